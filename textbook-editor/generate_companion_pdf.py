@@ -10,7 +10,7 @@ Converts the BROWNFIELD-COMPANION.md into a professional PDF with:
 """
 
 import re
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 
 # Configuration
@@ -18,65 +18,112 @@ SOURCE_FILE = Path.home() / "projects/vvroom/textbook-editor/BROWNFIELD-COMPANIO
 OUTPUT_DIR = Path.home() / "projects/vvroom/textbook-editor"
 OUTPUT_PDF = OUTPUT_DIR / "brownfield-companion.pdf"
 OUTPUT_HTML = OUTPUT_DIR / "brownfield-companion.html"
+OUTPUT_HTML_KEY = OUTPUT_HTML.with_suffix('.html.key')  # source stat OUTPUT_HTML was built from
+WEASYPRINT_CACHE = OUTPUT_DIR / ".weasyprint-cache"  # kept between runs
+
+# HTML escaping in a single translate pass
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Line prefixes that start a block element (closing tags included)
+_BLOCK_TAGS = ('<h1', '<h2', '<h3', '<h4', '<pre', '<ul', '<ol', '<table', '<hr', '<div', '</')
+
+# Table cell templates, formatted a row at a time with map()
+_TH = '<th>{}</th>'
+_TD = '<td>{}</td>'
+
+# Compiled patterns, shared by every call
+_RE_CODE_BLOCK = re.compile(r'```(\w*)\n?([\s\S]*?)```')
+_RE_HEADER = re.compile(r'^(#{1,4}) (.+)$', re.MULTILINE)
+_RE_BOLD_ITALIC = re.compile(r'\*\*\*(.+?)\*\*\*')
+_RE_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_RE_ITALIC = re.compile(r'\*(.+?)\*')
+_RE_INLINE_CODE = re.compile(r'`([^`]+)`')
+_RE_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_HR = re.compile(r'^---+$', re.MULTILINE)
+_RE_UL_ITEM = re.compile(r'^(\s*)[-*+] (.+)$', re.MULTILINE)
+_RE_OL_ITEM = re.compile(r'^(\s*)\d+\. (.+)$', re.MULTILINE)
+_RE_CHECKBOX_UNCHECKED = re.compile(r'<li>\[ \] (.+)</li>')
+_RE_CHECKBOX_CHECKED = re.compile(r'<li>\[x\] (.+)</li>')
+_RE_ESCAPED_ENTITY = re.compile(r'&(?:amp|lt|gt);')
+_RE_ANCHOR_CLEAN = re.compile(r'[^\w\s-]')
+_RE_WHITESPACE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=32)
+def _fence_tags(lang: str) -> tuple:
+    """Opening and closing markup for a code block in the given language."""
+    return f'<pre class="code-block {lang}"><code>', '</code></pre>'
+
+
+def markdown_to_html(md_content: str, toc: list = None) -> str:
+    """Convert markdown to HTML with syntax highlighting for code blocks.
+
+    Headers are given id anchors. If a toc list is passed, a
+    (level, title, anchor) entry is appended to it for each h1-h3.
+    """
+    if '```' not in md_content:
+        # No fenced blocks - escape everything in one go
+        html = md_content.translate(_HTML_ESCAPE)
+    else:
+        # Escape HTML outside code blocks and format the code blocks, in one sweep
+        parts = []
+        last = 0
+        for match in _RE_CODE_BLOCK.finditer(md_content):
+            parts.append(md_content[last:match.start()].translate(_HTML_ESCAPE))
+            open_tag, close_tag = _fence_tags(match.group(1) or 'text')
+            parts.append(open_tag)
+            parts.append(match.group(2).translate(_HTML_ESCAPE))
+            parts.append(close_tag)
+            last = match.end()
+        parts.append(md_content[last:].translate(_HTML_ESCAPE))
+        html = ''.join(parts)
+
+    # Headers - anchored, and tracked for TOC
+    def header_html(match):
+        level = len(match.group(1))
+        title = match.group(2)
+        # Anchor from the unescaped title, as written in the markdown
+        anchor = slugify(_RE_ESCAPED_ENTITY.sub('', title))
+        if toc is not None and level <= 3:
+            toc.append((level, title, anchor))
+        return f'<h{level} id="{anchor}">{title}</h{level}>'
 
-
-def markdown_to_html(md_content: str) -> str:
-    """Convert markdown to HTML with syntax highlighting for code blocks."""
-    html = md_content
-
-    # Extract code blocks first
-    code_blocks = []
-    def save_code_block(match):
-        code_blocks.append(match.group(0))
-        return f"__CODE_BLOCK_{len(code_blocks) - 1}__"
-
-    html = re.sub(r'```[\s\S]*?```', save_code_block, html)
-
-    # Escape HTML in non-code content
-    html = html.replace('&', '&amp;')
-    html = html.replace('<', '&lt;')
-    html = html.replace('>', '&gt;')
-
-    # Restore code blocks and format them
-    for i, block in enumerate(code_blocks):
-        match = re.match(r'```(\w*)\n?([\s\S]*?)```', block)
-        if match:
-            lang = match.group(1) or 'text'
-            code = match.group(2)
-            code = code.replace('&', '&amp;')
-            code = code.replace('<', '&lt;')
-            code = code.replace('>', '&gt;')
-            formatted = f'<pre class="code-block {lang}"><code>{code}</code></pre>'
-        else:
-            formatted = f'<pre class="code-block"><code>{block}</code></pre>'
-        html = html.replace(f"__CODE_BLOCK_{i}__", formatted)
-
-    # Headers - track for TOC
-    html = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
+    html = _RE_HEADER.sub(header_html, html)
 
     # Bold and italic
-    html = re.sub(r'\*\*\*(.+?)\*\*\*', r'<strong><em>\1</em></strong>', html)
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
+    html = _RE_BOLD_ITALIC.sub(r'<strong><em>\1</em></strong>', html)
+    html = _RE_BOLD.sub(r'<strong>\1</strong>', html)
+    html = _RE_ITALIC.sub(r'<em>\1</em>', html)
 
     # Inline code
-    html = re.sub(r'`([^`]+)`', r'<code class="inline">\1</code>', html)
+    html = _RE_INLINE_CODE.sub(r'<code class="inline">\1</code>', html)
 
-    # Links - handle anchor links specially
-    html = re.sub(r'\[([^\]]+)\]\(#([^)]+)\)', r'<a href="#\2">\1</a>', html)
-    html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
+    # Links (anchor links need no special case: the href is copied verbatim)
+    html = _RE_LINK.sub(r'<a href="\2">\1</a>', html)
 
     # Horizontal rules
-    html = re.sub(r'^---+$', '<hr class="section-break">', html, flags=re.MULTILINE)
+    html = _RE_HR.sub('<hr class="section-break">', html)
+
+    # Lists - unordered
+    html = _RE_UL_ITEM.sub(r'\1<li>\2</li>', html)
 
-    # Tables
+    # Lists - ordered
+    html = _RE_OL_ITEM.sub(r'\1<li>\2</li>', html)
+
+    # Checkbox items
+    html = _RE_CHECKBOX_UNCHECKED.sub(r'<li class="checkbox unchecked">\1</li>', html)
+    html = _RE_CHECKBOX_CHECKED.sub(r'<li class="checkbox checked">\1</li>', html)
+
+    # Block-level phases are chained generators, so the lines are walked
+    # once: split once, joined once
     lines = html.split('\n')
+    return '\n'.join(_transform_paragraphs(_transform_lists(_transform_tables(lines))))
+
+
+def _transform_tables(lines):
+    """Replace runs of markdown table lines with the lines of an HTML table."""
     in_table = False
     table_lines = []
-    new_lines = []
 
     for line in lines:
         if line.strip().startswith('|') and '|' in line[1:]:
@@ -86,36 +133,46 @@ def markdown_to_html(md_content: str) -> str:
             table_lines.append(line)
         else:
             if in_table:
-                new_lines.append(process_table(table_lines))
+                yield from _table_html_lines(table_lines)
                 in_table = False
                 table_lines = []
-            new_lines.append(line)
+            yield line
 
     if in_table:
-        new_lines.append(process_table(table_lines))
+        yield from _table_html_lines(table_lines)
 
-    html = '\n'.join(new_lines)
 
-    # Lists - unordered
-    html = re.sub(r'^(\s*)[-*+] (.+)$', r'\1<li>\2</li>', html, flags=re.MULTILINE)
+def _transform_lists(lines):
+    """Wrap each run of consecutive <li> lines in <ul>.
 
-    # Lists - ordered
-    html = re.sub(r'^(\s*)\d+\. (.+)$', r'\1<li>\2</li>', html, flags=re.MULTILINE)
-
-    # Checkbox items
-    html = re.sub(r'<li>\[ \] (.+)</li>', r'<li class="checkbox unchecked">\1</li>', html)
-    html = re.sub(r'<li>\[x\] (.+)</li>', r'<li class="checkbox checked">\1</li>', html)
-
-    # Wrap consecutive <li> elements in <ul>
-    html = re.sub(r'((?:<li[^>]*>.*?</li>\n?)+)', r'<ul>\1</ul>', html)
-
-    # Paragraphs
-    lines = html.split('\n')
+    A run continues while the next line starts with <li; the closing </ul>
+    is prefixed to the first line after the run (or appended to the last
+    line), so each line is held back one step.
+    """
+    in_list = False
+    previous = None
+    for line in lines:
+        if not (in_list and line.startswith('<li')):
+            prefix = '</ul>' if in_list else ''
+            start = line.find('<li')
+            if start >= 0:
+                line = f'{prefix}{line[:start]}<ul>{line[start:]}'
+                in_list = True
+            else:
+                line = prefix + line
+                in_list = False
+        if previous is not None:
+            yield previous
+        previous = line
+    if previous is not None:
+        yield previous + '</ul>' if in_list else previous
+
+
+def _transform_paragraphs(lines) -> list:
+    """Wrap runs of non-block lines in <p> elements."""
     result_lines = []
     para_buffer = []
 
-    block_tags = ['<h1', '<h2', '<h3', '<h4', '<pre', '<ul', '<ol', '<table', '<hr', '<div']
-
     for line in lines:
         stripped = line.strip()
         if not stripped:
@@ -123,7 +180,7 @@ def markdown_to_html(md_content: str) -> str:
                 result_lines.append('<p>' + ' '.join(para_buffer) + '</p>')
                 para_buffer = []
             result_lines.append('')
-        elif any(stripped.startswith(tag) for tag in block_tags) or stripped.startswith('</'):
+        elif stripped.startswith(_BLOCK_TAGS):
             if para_buffer:
                 result_lines.append('<p>' + ' '.join(para_buffer) + '</p>')
                 para_buffer = []
@@ -134,225 +191,183 @@ def markdown_to_html(md_content: str) -> str:
     if para_buffer:
         result_lines.append('<p>' + ' '.join(para_buffer) + '</p>')
 
-    return '\n'.join(result_lines)
+    return result_lines
 
 
 def process_table(lines: list) -> str:
     """Convert markdown table lines to HTML table."""
+    return '\n'.join(_table_html_lines(lines))
+
+
+def _table_html_lines(lines: list):
+    """Yield the HTML lines of a markdown table (the lines unchanged if too short)."""
     if len(lines) < 2:
-        return '\n'.join(lines)
+        yield from lines
+        return
 
-    html = ['<table>']
+    yield '<table>'
 
     # Header row
-    header_cells = [cell.strip() for cell in lines[0].split('|')[1:-1]]
-    html.append('<thead><tr>')
-    for cell in header_cells:
-        html.append(f'<th>{cell}</th>')
-    html.append('</tr></thead>')
+    yield '<thead><tr>'
+    yield from map(_TH.format, map(str.strip, lines[0].split('|')[1:-1]))
+    yield '</tr></thead>'
 
     # Skip separator row and process data rows
-    html.append('<tbody>')
+    yield '<tbody>'
     for line in lines[2:]:
-        cells = [cell.strip() for cell in line.split('|')[1:-1]]
-        html.append('<tr>')
-        for cell in cells:
-            html.append(f'<td>{cell}</td>')
-        html.append('</tr>')
-    html.append('</tbody>')
-    html.append('</table>')
-
-    return '\n'.join(html)
-
-
-def extract_toc(md_content: str) -> list:
-    """Extract table of contents entries from markdown."""
-    toc = []
-    # Find all headers
-    for match in re.finditer(r'^(#{1,3}) (.+)$', md_content, re.MULTILINE):
-        level = len(match.group(1))
-        title = match.group(2)
-        # Create anchor from title
-        anchor = re.sub(r'[^\w\s-]', '', title.lower())
-        anchor = re.sub(r'\s+', '-', anchor)
-        toc.append((level, title, anchor))
-    return toc
+        yield '<tr>'
+        yield from map(_TD.format, map(str.strip, line.split('|')[1:-1]))
+        yield '</tr>'
+    yield '</tbody>'
+    yield '</table>'
+
+
+@lru_cache(maxsize=512)
+def slugify(title: str) -> str:
+    """Create a header anchor from a title."""
+    anchor = _RE_ANCHOR_CLEAN.sub('', title.lower())
+    return _RE_WHITESPACE.sub('-', anchor)
 
 
 def generate_toc_html(toc_entries: list) -> str:
     """Generate HTML table of contents."""
-    html = ['<div class="toc">']
-    html.append('<h1>Table of Contents</h1>')
+    return '\n'.join(_toc_lines(toc_entries))
+
 
-    current_level = 0
+def _toc_lines(toc_entries: list):
+    """Yield the TOC markup, one chunk per entry."""
+    yield '<div class="toc">\n<h1>Table of Contents</h1>'
 
     for level, title, anchor in toc_entries:
         # Skip the main title
         if level == 1 and 'Brownfield Companion' in title:
             continue
 
-        indent_class = f"toc-level-{level}"
-        html.append(f'<div class="toc-entry {indent_class}">')
-        html.append(f'<a href="#{anchor}">{title}</a>')
-        html.append('</div>')
+        yield (f'<div class="toc-entry toc-level-{level}">\n'
+               f'<a href="#{anchor}">{title}</a>\n'
+               '</div>')
 
-    html.append('</div>')
-    return '\n'.join(html)
+    yield '</div>'
 
 
-def add_anchors_to_html(html: str) -> str:
-    """Add id anchors to headers for TOC linking."""
-    def add_anchor(match):
-        tag = match.group(1)
-        title = match.group(2)
-        # Create anchor from title
-        anchor = re.sub(r'[^\w\s-]', '', title.lower())
-        anchor = re.sub(r'\s+', '-', anchor)
-        # Remove HTML tags from title for anchor
-        clean_title = re.sub(r'<[^>]+>', '', title)
-        anchor = re.sub(r'[^\w\s-]', '', clean_title.lower())
-        anchor = re.sub(r'\s+', '-', anchor)
-        return f'<{tag} id="{anchor}">{title}</{tag}>'
-
-    html = re.sub(r'<(h[1-4])>(.+?)</\1>', add_anchor, html)
-    return html
-
-
-def generate_html(source_file: Path) -> str:
-    """Generate complete HTML document from markdown."""
-
-    content = source_file.read_text(encoding='utf-8')
-
-    # Extract TOC first
-    toc_entries = extract_toc(content)
-
-    # Convert markdown to HTML
-    body_html = markdown_to_html(content)
-
-    # Add anchors for TOC links
-    body_html = add_anchors_to_html(body_html)
-
-    # Generate TOC HTML
-    toc_html = generate_toc_html(toc_entries)
-
-    # Build complete document
-    html = f'''<!DOCTYPE html>
+# Document shell around the TOC and body (title page and stylesheet included)
+_HTML_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <title>Brownfield Companion: Integrating URL-First Architecture</title>
     <style>
-        @page {{
+        @page {
             size: letter;
             margin: 1in 0.75in;
-            @top-center {{
+            @top-center {
                 content: "Brownfield Companion";
                 font-size: 10pt;
                 color: #666;
-            }}
-            @bottom-center {{
+            }
+            @bottom-center {
                 content: counter(page);
                 font-size: 10pt;
-            }}
-        }}
+            }
+        }
 
-        @page:first {{
-            @top-center {{ content: none; }}
-        }}
+        @page:first {
+            @top-center { content: none; }
+        }
 
-        @page toc {{
-            @top-center {{ content: "Table of Contents"; }}
-        }}
+        @page toc {
+            @top-center { content: "Table of Contents"; }
+        }
 
-        * {{
+        * {
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Georgia', 'Times New Roman', serif;
             font-size: 11pt;
             line-height: 1.5;
             color: #333;
             max-width: 100%;
-        }}
+        }
 
         /* Title page */
-        .title-page {{
+        .title-page {
             page: title;
             text-align: center;
             padding-top: 2.5in;
             page-break-after: always;
-        }}
+        }
 
-        .title-page h1 {{
+        .title-page h1 {
             font-size: 32pt;
             margin-bottom: 0.3in;
             color: #2d5016;
-        }}
+        }
 
-        .title-page .subtitle {{
+        .title-page .subtitle {
             font-size: 16pt;
             color: #4a5568;
             margin-bottom: 0.5in;
-        }}
+        }
 
-        .title-page .meta {{
+        .title-page .meta {
             font-size: 11pt;
             color: #718096;
             margin-top: 1in;
             line-height: 1.8;
-        }}
+        }
 
-        .title-page .meta strong {{
+        .title-page .meta strong {
             color: #4a5568;
-        }}
+        }
 
         /* Table of Contents */
-        .toc {{
+        .toc {
             page: toc;
             page-break-after: always;
-        }}
+        }
 
-        .toc h1 {{
+        .toc h1 {
             font-size: 24pt;
             margin-bottom: 0.5in;
             color: #2d5016;
             border-bottom: 2px solid #2d5016;
             padding-bottom: 0.25in;
-        }}
+        }
 
-        .toc-entry {{
+        .toc-entry {
             padding: 0.05in 0;
             font-size: 10pt;
-        }}
+        }
 
-        .toc-entry a {{
+        .toc-entry a {
             color: #2b6cb0;
             text-decoration: none;
-        }}
+        }
 
-        .toc-level-1 {{
+        .toc-level-1 {
             font-weight: bold;
             font-size: 12pt;
             margin-top: 0.15in;
-        }}
+        }
 
-        .toc-level-2 {{
+        .toc-level-2 {
             padding-left: 0.2in;
-        }}
+        }
 
-        .toc-level-3 {{
+        .toc-level-3 {
             padding-left: 0.4in;
             font-size: 9pt;
-        }}
+        }
 
         /* Main content */
-        .content {{
+        .content {
             page-break-before: always;
-        }}
+        }
 
         /* Content headings */
-        h1 {{
+        h1 {
             font-size: 22pt;
             color: #2d5016;
             margin-top: 0.4in;
@@ -360,40 +375,40 @@ def generate_html(source_file: Path) -> str:
             page-break-after: avoid;
             border-bottom: 2px solid #2d5016;
             padding-bottom: 0.1in;
-        }}
+        }
 
-        h2 {{
+        h2 {
             font-size: 16pt;
             color: #3d6b22;
             margin-top: 0.3in;
             margin-bottom: 0.15in;
             page-break-after: avoid;
-        }}
+        }
 
-        h3 {{
+        h3 {
             font-size: 13pt;
             color: #4a5568;
             margin-top: 0.25in;
             margin-bottom: 0.1in;
             page-break-after: avoid;
-        }}
+        }
 
-        h4 {{
+        h4 {
             font-size: 11pt;
             color: #4a5568;
             margin-top: 0.2in;
             margin-bottom: 0.1in;
             page-break-after: avoid;
-        }}
+        }
 
         /* Paragraphs */
-        p {{
+        p {
             margin: 0.1in 0;
             text-align: justify;
-        }}
+        }
 
         /* Code blocks */
-        pre.code-block {{
+        pre.code-block {
             background: #1a202c;
             color: #e2e8f0;
             padding: 0.15in;
@@ -407,103 +422,103 @@ def generate_html(source_file: Path) -> str:
             page-break-inside: avoid;
             margin: 0.12in 0;
             border-left: 3px solid #48bb78;
-        }}
+        }
 
-        code.inline {{
+        code.inline {
             background: #edf2f7;
             color: #22543d;
             padding: 0.02in 0.05in;
             border-radius: 3px;
             font-family: 'Consolas', 'Monaco', monospace;
             font-size: 9.5pt;
-        }}
+        }
 
         /* Tables */
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin: 0.15in 0;
             font-size: 9.5pt;
             page-break-inside: avoid;
-        }}
+        }
 
-        th, td {{
+        th, td {
             border: 1px solid #cbd5e0;
             padding: 0.08in 0.12in;
             text-align: left;
-        }}
+        }
 
-        th {{
+        th {
             background: #c6f6d5;
             font-weight: bold;
             color: #22543d;
-        }}
+        }
 
-        tr:nth-child(even) {{
+        tr:nth-child(even) {
             background: #f0fff4;
-        }}
+        }
 
         /* Lists */
-        ul, ol {{
+        ul, ol {
             margin: 0.1in 0;
             padding-left: 0.3in;
-        }}
+        }
 
-        li {{
+        li {
             margin: 0.03in 0;
-        }}
+        }
 
-        li.checkbox {{
+        li.checkbox {
             list-style: none;
             margin-left: -0.2in;
-        }}
+        }
 
-        li.checkbox::before {{
+        li.checkbox::before {
             content: "☐ ";
             color: #718096;
-        }}
+        }
 
-        li.checkbox.checked::before {{
+        li.checkbox.checked::before {
             content: "☑ ";
             color: #48bb78;
-        }}
+        }
 
         /* Horizontal rules */
-        hr {{
+        hr {
             border: none;
             border-top: 1px solid #cbd5e0;
             margin: 0.2in 0;
-        }}
+        }
 
-        hr.section-break {{
+        hr.section-break {
             border-top: 2px solid #c6f6d5;
             margin: 0.3in 0;
-        }}
+        }
 
         /* Links */
-        a {{
+        a {
             color: #2b6cb0;
             text-decoration: none;
-        }}
+        }
 
         /* Strong/emphasis */
-        strong {{ font-weight: bold; }}
-        em {{ font-style: italic; }}
+        strong { font-weight: bold; }
+        em { font-style: italic; }
 
         /* ASCII diagrams - preserve formatting */
-        pre.code-block.text {{
+        pre.code-block.text {
             background: #f7fafc;
             color: #2d3748;
             border-left-color: #a0aec0;
-        }}
+        }
 
         /* Special callout for key insights */
-        p:has(strong:first-child) {{
+        p:has(strong:first-child) {
             background: #f0fff4;
             padding: 0.1in;
             border-left: 3px solid #48bb78;
             margin: 0.15in 0;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -520,42 +535,111 @@ def generate_html(source_file: Path) -> str:
     </div>
 
     <!-- Table of Contents -->
-    {toc_html}
+    '''
+
+_HTML_CONTENT_START = '''
 
     <!-- Main Content -->
     <div class="content">
-        {body_html}
+        '''
+
+_HTML_TAIL = '''
     </div>
 
 </body>
 </html>
 '''
 
-    return html
+
+def generate_html(source_file: Path) -> str:
+    """Generate complete HTML document from markdown."""
+
+    content = source_file.read_text(encoding='utf-8')
+
+    # Convert markdown to HTML, collecting the TOC from its headers
+    toc_entries = []
+    body_html = markdown_to_html(content, toc_entries)
+
+    # Generate TOC HTML
+    toc_html = generate_toc_html(toc_entries)
+
+    # Build complete document
+    return _HTML_HEAD + toc_html + _HTML_CONTENT_START + body_html + _HTML_TAIL
+
+
+def source_key(source_file: Path) -> str:
+    """Identify a build input by the (mtime, size) of the source and of this script."""
+    source_stat = source_file.stat()
+    script_stat = Path(__file__).stat()
+    return f"{source_stat.st_mtime_ns}:{source_stat.st_size}:{script_stat.st_mtime_ns}"
+
+
+@lru_cache(maxsize=None)
+def _load_weasyprint():
+    """Import weasyprint on first use.
+
+    Returns (HTML, font_config), or None when only the weasyprint CLI is
+    available.
+    """
+    try:
+        from weasyprint import HTML
+        from weasyprint.text.fonts import FontConfiguration
+    except ImportError:
+        return None
+    return HTML, FontConfiguration()
+
+
+def write_pdf(html_content: str) -> str:
+    """Render the HTML to OUTPUT_PDF. Returns an error message, or '' on success."""
+    weasyprint = _load_weasyprint()
+    if weasyprint is None:
+        import subprocess
+        result = subprocess.run(
+            ['weasyprint', '--optimize-images', '--cache-folder', str(WEASYPRINT_CACHE),
+             str(OUTPUT_HTML), str(OUTPUT_PDF)],
+            capture_output=True,
+            text=True
+        )
+        return result.stderr if result.returncode != 0 else ''
+
+    HTML, font_config = weasyprint
+    try:
+        HTML(string=html_content, base_url=str(OUTPUT_DIR)).write_pdf(
+            str(OUTPUT_PDF), font_config=font_config,
+            optimize_images=True, cache=str(WEASYPRINT_CACHE)
+        )
+    except Exception as e:
+        return str(e)
+    return ''
 
 
 def main():
-    print("Generating HTML from BROWNFIELD-COMPANION.md...")
-    html_content = generate_html(SOURCE_FILE)
+    key = source_key(SOURCE_FILE)
+
+    if (OUTPUT_HTML.exists() and OUTPUT_HTML_KEY.exists()
+            and OUTPUT_HTML_KEY.read_text(encoding='utf-8') == key):
+        # Source unchanged since the last build - reuse the HTML
+        print(f"BROWNFIELD-COMPANION.md unchanged, reusing: {OUTPUT_HTML}")
+        html_content = OUTPUT_HTML.read_text(encoding='utf-8')
+    else:
+        print("Generating HTML from BROWNFIELD-COMPANION.md...")
+        html_content = generate_html(SOURCE_FILE)
 
-    # Write HTML file
-    OUTPUT_HTML.write_text(html_content, encoding='utf-8')
-    print(f"HTML written to: {OUTPUT_HTML}")
+        # Write HTML file
+        OUTPUT_HTML.write_text(html_content, encoding='utf-8')
+        OUTPUT_HTML_KEY.write_text(key, encoding='utf-8')
+        print(f"HTML written to: {OUTPUT_HTML}")
 
     # Generate PDF using weasyprint
     print("Generating PDF with weasyprint...")
-    result = subprocess.run(
-        ['weasyprint', str(OUTPUT_HTML), str(OUTPUT_PDF)],
-        capture_output=True,
-        text=True
-    )
+    error = write_pdf(html_content)
 
-    if result.returncode == 0:
+    if not error:
         print(f"PDF generated: {OUTPUT_PDF}")
         size_kb = OUTPUT_PDF.stat().st_size / 1024
         print(f"File size: {size_kb:.0f} KB")
     else:
-        print(f"Error generating PDF: {result.stderr}")
+        print(f"Error generating PDF: {error}")
         return 1
 
     return 0
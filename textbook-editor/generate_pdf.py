@@ -9,16 +9,49 @@ Combines all split markdown pages into a single PDF with:
 - Professional formatting
 """
 
+import hashlib
+import io
+import os
 import re
 import subprocess
+import sys
+import tempfile
+import threading
 from pathlib import Path
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 
 # Configuration
 PAGES_DIR = Path.home() / "projects/vvroom/textbook-pages"
 OUTPUT_DIR = Path.home() / "projects/vvroom/textbook-editor"
 OUTPUT_PDF = OUTPUT_DIR / "vvroom-textbook.pdf"
 OUTPUT_HTML = OUTPUT_DIR / "vvroom-textbook.html"
+PAGE_CACHE_DIR = OUTPUT_DIR / ".page-html-cache"
+
+# HTML escaping in a single translate pass
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Line prefixes that start a block element (closing tags included)
+_BLOCK_TAGS = ('<h1', '<h2', '<h3', '<h4', '<pre', '<ul', '<ol', '<table', '<hr', '<div', '</')
+
+# Table cell templates, formatted a row at a time with map()
+_TH = '<th>{}</th>'
+_TD = '<td>{}</td>'
+
+# Compiled patterns, shared by every page
+_RE_CODE_BLOCK = re.compile(r'```(\w*)\n?([\s\S]*?)```')
+# Whole-line constructs - headers and horizontal rules - in one pass
+_RE_LINE_BLOCK = re.compile(r'^(?:(?P<hashes>#{1,4}) (?P<title>.+)|(?P<hr>---+))$', re.MULTILINE)
+_RE_BOLD_ITALIC = re.compile(r'\*\*\*(.+?)\*\*\*')
+_RE_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_RE_ITALIC = re.compile(r'\*(.+?)\*')
+_RE_INLINE_CODE = re.compile(r'`([^`]+)`')
+_RE_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+# One list item line, unordered (-, *, +) or ordered (1.)
+_RE_LIST_ITEM = re.compile(r'^(\s*)(?:[-*+]|\d+\.) (.+)$')
+_RE_PAGE_FILE = re.compile(r'^([A-Z]?\d+)-p(\d+)\.md$')
 
 # Chapter metadata - maps prefix to chapter info
 CHAPTER_INFO = {
@@ -101,107 +134,115 @@ CHAPTER_INFO = {
 
 def get_chapter_info(prefix: str) -> tuple:
     """Get chapter category and title for a prefix."""
-    return CHAPTER_INFO.get(prefix, ("Unknown", f"Section {prefix}"))
+    info = CHAPTER_INFO.get(prefix)
+    if info is None:
+        # Only format the fallback on a miss
+        info = ("Unknown", f"Section {prefix}")
+    return info
 
 
-def markdown_to_html(md_content: str) -> str:
-    """Convert markdown to HTML with syntax highlighting for code blocks."""
-    # Simple markdown conversion - handle common patterns
-    html = md_content
-
-    # Escape HTML entities first (but not in code blocks)
-    # We'll handle code blocks separately
-
-    # Extract code blocks first
-    code_blocks = []
-    def save_code_block(match):
-        code_blocks.append(match.group(0))
-        return f"__CODE_BLOCK_{len(code_blocks) - 1}__"
-
-    html = re.sub(r'```[\s\S]*?```', save_code_block, html)
+def _line_block_html(match) -> str:
+    """Render a header line as <hN> (N being the number of #s), or a rule as <hr>."""
+    if match.group('hr'):
+        return '<hr>'
+    level = len(match.group('hashes'))
+    return f'<h{level}>{match.group("title")}</h{level}>'
 
-    # Escape HTML in non-code content
-    html = html.replace('&', '&amp;')
-    html = html.replace('<', '&lt;')
-    html = html.replace('>', '&gt;')
 
-    # Restore code blocks and format them
-    for i, block in enumerate(code_blocks):
-        # Extract language and code
-        match = re.match(r'```(\w*)\n?([\s\S]*?)```', block)
-        if match:
+def markdown_to_html(md_content: str) -> str:
+    """Convert markdown to HTML with syntax highlighting for code blocks."""
+    if '```' not in md_content:
+        # No fenced blocks - escape everything in one go
+        html = md_content.translate(_HTML_ESCAPE)
+    else:
+        # Escape HTML outside code blocks and format the code blocks, in one sweep
+        parts = []
+        last = 0
+        for match in _RE_CODE_BLOCK.finditer(md_content):
             lang = match.group(1) or 'text'
-            code = match.group(2)
-            # Escape HTML in code
-            code = code.replace('&', '&amp;')
-            code = code.replace('<', '&lt;')
-            code = code.replace('>', '&gt;')
-            formatted = f'<pre class="code-block {lang}"><code>{code}</code></pre>'
-        else:
-            formatted = f'<pre class="code-block"><code>{block}</code></pre>'
-        html = html.replace(f"__CODE_BLOCK_{i}__", formatted)
+            code = match.group(2).translate(_HTML_ESCAPE)
+            parts.append(md_content[last:match.start()].translate(_HTML_ESCAPE))
+            parts.append(f'<pre class="code-block {lang}"><code>{code}</code></pre>')
+            last = match.end()
+        parts.append(md_content[last:].translate(_HTML_ESCAPE))
+        html = ''.join(parts)
 
-    # Headers
-    html = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
+    # Headers and horizontal rules
+    html = _RE_LINE_BLOCK.sub(_line_block_html, html)
 
     # Bold and italic
-    html = re.sub(r'\*\*\*(.+?)\*\*\*', r'<strong><em>\1</em></strong>', html)
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
+    html = _RE_BOLD_ITALIC.sub(r'<strong><em>\1</em></strong>', html)
+    html = _RE_BOLD.sub(r'<strong>\1</strong>', html)
+    html = _RE_ITALIC.sub(r'<em>\1</em>', html)
 
     # Inline code
-    html = re.sub(r'`([^`]+)`', r'<code class="inline">\1</code>', html)
+    html = _RE_INLINE_CODE.sub(r'<code class="inline">\1</code>', html)
 
     # Links
-    html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
+    html = _RE_LINK.sub(r'<a href="\2">\1</a>', html)
 
-    # Horizontal rules
-    html = re.sub(r'^---+$', '<hr>', html, flags=re.MULTILINE)
-
-    # Tables
+    # Block-level phases are chained generators, so the lines are walked
+    # once: split once, joined once
     lines = html.split('\n')
+    return '\n'.join(_transform_paragraphs(_transform_lists(_transform_tables(lines))))
+
+
+def _transform_tables(lines):
+    """Replace runs of markdown table lines with the lines of an HTML table."""
     in_table = False
     table_lines = []
-    new_lines = []
 
     for line in lines:
-        if line.strip().startswith('|') and '|' in line[1:]:
+        # Cheap containment test first - most lines have no pipe at all
+        if '|' in line and line.lstrip().startswith('|') and '|' in line[1:]:
             if not in_table:
                 in_table = True
                 table_lines = []
             table_lines.append(line)
         else:
             if in_table:
-                # Process the table
-                new_lines.append(process_table(table_lines))
+                yield from _table_html_lines(table_lines)
                 in_table = False
                 table_lines = []
-            new_lines.append(line)
+            yield line
 
     if in_table:
-        new_lines.append(process_table(table_lines))
-
-    html = '\n'.join(new_lines)
-
-    # Lists - unordered
-    html = re.sub(r'^(\s*)[-*+] (.+)$', r'\1<li>\2</li>', html, flags=re.MULTILINE)
+        yield from _table_html_lines(table_lines)
 
-    # Lists - ordered
-    html = re.sub(r'^(\s*)\d+\. (.+)$', r'\1<li>\2</li>', html, flags=re.MULTILINE)
 
-    # Wrap consecutive <li> elements in <ul>
-    html = re.sub(r'((?:<li>.*?</li>\n?)+)', r'<ul>\1</ul>', html)
+def _transform_lists(lines):
+    """Turn list item lines into <li> and wrap each run of them in <ul>.
 
-    # Paragraphs - wrap non-tagged lines
-    lines = html.split('\n')
+    A run continues while the next line starts with <li> unindented; the
+    closing </ul> is prefixed to the first line after the run (or appended
+    to the last line), so each line is held back one step.
+    """
+    in_list = False
+    previous = None
+    for line in lines:
+        item = _RE_LIST_ITEM.match(line)
+        if item:
+            line = f'{item.group(1)}<li>{item.group(2)}</li>'
+        if not (in_list and item and not item.group(1)):
+            prefix = '</ul>' if in_list else ''
+            if item:
+                line = f'{prefix}{item.group(1)}<ul>{line[len(item.group(1)):]}'
+                in_list = True
+            else:
+                line = prefix + line
+                in_list = False
+        if previous is not None:
+            yield previous
+        previous = line
+    if previous is not None:
+        yield previous + '</ul>' if in_list else previous
+
+
+def _transform_paragraphs(lines) -> list:
+    """Wrap runs of non-block lines in <p> elements."""
     result_lines = []
     para_buffer = []
 
-    block_tags = ['<h1', '<h2', '<h3', '<h4', '<pre', '<ul', '<ol', '<table', '<hr', '<div']
-
     for line in lines:
         stripped = line.strip()
         if not stripped:
@@ -209,7 +250,7 @@ def markdown_to_html(md_content: str) -> str:
                 result_lines.append('<p>' + ' '.join(para_buffer) + '</p>')
                 para_buffer = []
             result_lines.append('')
-        elif any(stripped.startswith(tag) for tag in block_tags) or stripped.startswith('</'):
+        elif stripped.startswith(_BLOCK_TAGS):
             if para_buffer:
                 result_lines.append('<p>' + ' '.join(para_buffer) + '</p>')
                 para_buffer = []
@@ -220,91 +261,170 @@ def markdown_to_html(md_content: str) -> str:
     if para_buffer:
         result_lines.append('<p>' + ' '.join(para_buffer) + '</p>')
 
-    return '\n'.join(result_lines)
+    return result_lines
 
 
 def process_table(lines: list) -> str:
     """Convert markdown table lines to HTML table."""
+    return '\n'.join(_table_html_lines(lines))
+
+
+def _table_html_lines(lines: list):
+    """Yield the HTML lines of a markdown table (the lines unchanged if too short)."""
     if len(lines) < 2:
-        return '\n'.join(lines)
+        yield from lines
+        return
 
-    html = ['<table>']
+    yield '<table>'
 
     # Header row
-    header_cells = [cell.strip() for cell in lines[0].split('|')[1:-1]]
-    html.append('<thead><tr>')
-    for cell in header_cells:
-        html.append(f'<th>{cell}</th>')
-    html.append('</tr></thead>')
+    yield '<thead><tr>'
+    yield from map(_TH.format, map(str.strip, lines[0].split('|')[1:-1]))
+    yield '</tr></thead>'
 
     # Skip separator row (line 1) and process data rows
-    html.append('<tbody>')
+    yield '<tbody>'
     for line in lines[2:]:
-        cells = [cell.strip() for cell in line.split('|')[1:-1]]
-        html.append('<tr>')
-        for cell in cells:
-            html.append(f'<td>{cell}</td>')
-        html.append('</tr>')
-    html.append('</tbody>')
-    html.append('</table>')
+        yield '<tr>'
+        yield from map(_TD.format, map(str.strip, line.split('|')[1:-1]))
+        yield '</tr>'
+    yield '</tbody>'
+    yield '</table>'
+
+
+def read_page(page_file: Path) -> str:
+    """Read a markdown page as text, with read_text()'s newline handling.
+
+    The file is decoded in one call from its bytes, skipping the text
+    layer's incremental decoding; \r and \r\n are only translated when present.
+    """
+    text = page_file.read_bytes().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def render_page(page_file: Path) -> str:
+    """Read one markdown page and convert it to HTML (runs in a worker process)."""
+    return markdown_to_html(read_page(page_file))
+
+
+def page_cache_key(page_file: Path) -> str:
+    """Identify a rendered page by its path, (mtime, size) and this script's mtime."""
+    page_stat = page_file.stat()
+    script_stat = Path(__file__).stat()
+    key = f"{page_file}:{page_stat.st_mtime_ns}:{page_stat.st_size}:{script_stat.st_mtime_ns}"
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _write_cache_entry(cache_dir: Path, key: str, html: str) -> None:
+    """Store a rendered page under its key, atomically.
+
+    The entry is written to a temporary name and renamed into place, so an
+    interrupted run can never leave a truncated file under a valid key.
+    Orphaned temporary files are not keys and get purged by the next run.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix='.tmp-')
+    try:
+        with open(fd, 'wb') as f:
+            f.write(html.encode('utf-8'))
+        os.replace(tmp_name, cache_dir / key)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def render_pages(page_files: list) -> dict:
+    """Convert pages to HTML, reusing cached output for unchanged pages.
+
+    Cache entries not used by this run are purged afterwards.
+    """
+    cache_dir = PAGE_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    keys = {page_file: page_cache_key(page_file) for page_file in page_files}
+
+    page_html = {}
+    stale = []
+    for page_file, key in keys.items():
+        cached = cache_dir / key
+        if cached.exists():
+            page_html[page_file] = cached.read_bytes().decode('utf-8')
+        else:
+            stale.append(page_file)
 
-    return '\n'.join(html)
+    # Convert changed pages, spread across CPU cores
+    if stale:
+        with ProcessPoolExecutor() as executor:
+            for page_file, html in zip(stale, executor.map(render_page, stale, chunksize=8)):
+                page_html[page_file] = html
+                _write_cache_entry(cache_dir, keys[page_file], html)
 
+    live = set(keys.values())
+    for entry in cache_dir.iterdir():
+        if entry.name not in live:
+            entry.unlink()
 
-def generate_toc(chapters: dict) -> str:
-    """Generate HTML table of contents."""
-    toc = ['<div class="toc">']
-    toc.append('<h1>Table of Contents</h1>')
+    return page_html
 
-    current_category = None
 
-    for prefix in sorted(chapters.keys()):
-        category, title = get_chapter_info(prefix)
-        page_count = len(chapters[prefix])
-
-        if category != current_category:
-            if current_category is not None:
-                toc.append('</div>')  # Close previous category
-            toc.append(f'<div class="toc-category">')
-            toc.append(f'<h2>{category}</h2>')
-            current_category = category
+def generate_toc(chapters: dict) -> str:
+    """Generate HTML table of contents (chapters in the dict's order)."""
+    return '\n'.join(_toc_lines(chapters))
 
-        toc.append(f'<div class="toc-entry">')
-        toc.append(f'<a href="#section-{prefix}">{prefix}: {title}</a>')
-        toc.append(f'<span class="toc-pages">({page_count} pages)</span>')
-        toc.append('</div>')
 
-    if current_category is not None:
-        toc.append('</div>')  # Close last category
+def _toc_lines(chapters: dict):
+    """Yield the TOC's lines, one toc-category block per run of a category."""
+    yield '<div class="toc">'
+    yield '<h1>Table of Contents</h1>'
 
-    toc.append('</div>')
-    return '\n'.join(toc)
+    entries = ((prefix, *get_chapter_info(prefix), len(pages)) for prefix, pages in chapters.items())
+    for category, group in groupby(entries, key=itemgetter(1)):
+        yield '<div class="toc-category">'
+        yield f'<h2>{category}</h2>'
+        for prefix, _, title, page_count in group:
+            yield (f'<div class="toc-entry">\n'
+                   f'<a href="#section-{prefix}">{prefix}: {title}</a>\n'
+                   f'<span class="toc-pages">({page_count} pages)</span>\n'
+                   f'</div>')
+        yield '</div>'
 
+    yield '</div>'
 
-def generate_html(pages_dir: Path) -> str:
-    """Generate complete HTML document from all pages."""
 
+def load_chapters(pages_dir: Path) -> tuple:
+    """Collect the pages by chapter and convert them. Returns (chapters, page_html)."""
     # Collect all pages by prefix
     chapters = defaultdict(list)
     for page_file in sorted(pages_dir.glob("*.md")):
         if page_file.name == "SPLIT_REPORT.txt":
             continue
         # Parse filename: {prefix}-p{num}.md
-        match = re.match(r'^([A-Z]?\d+)-p(\d+)\.md$', page_file.name)
+        match = _RE_PAGE_FILE.match(page_file.name)
         if match:
             prefix = match.group(1)
             page_num = int(match.group(2))
             chapters[prefix].append((page_num, page_file))
 
-    # Sort pages within each chapter
-    for prefix in chapters:
-        chapters[prefix].sort(key=lambda x: x[0])
+    # Order chapters by prefix once, and pages within each chapter
+    chapters = dict(sorted(chapters.items()))
+    for pages in chapters.values():
+        pages.sort(key=itemgetter(0))
+
+    # Convert every page up front
+    page_files = [page_file for pages in chapters.values() for _, page_file in pages]
+    page_html = render_pages(page_files)
+    return chapters, page_html
+
+
+def write_html(pages_dir: Path, out) -> None:
+    """Write the complete HTML document for all pages to a text stream, chapter by chapter."""
+    write_document(*load_chapters(pages_dir), out)
 
-    # Generate HTML
-    html_parts = []
 
+def write_document(chapters: dict, page_html: dict, out) -> None:
+    """Write the HTML document for already converted chapters to a text stream."""
     # Document header with styles
-    html_parts.append('''<!DOCTYPE html>
+    out.write('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -535,7 +655,7 @@ def generate_html(pages_dir: Path) -> str:
 ''')
 
     # Title page
-    html_parts.append('''
+    out.write('''
     <div class="title-page">
         <h1>VVRoom Textbook</h1>
         <div class="subtitle">Building a URL-First Angular Application</div>
@@ -544,62 +664,159 @@ def generate_html(pages_dir: Path) -> str:
 ''')
 
     # Table of contents
-    html_parts.append(generate_toc(chapters))
+    out.write(generate_toc(chapters))
 
     # Content
-    for prefix in sorted(chapters.keys()):
+    for prefix, pages in chapters.items():
         category, title = get_chapter_info(prefix)
-        pages = chapters[prefix]
 
-        # Chapter header
-        html_parts.append(f'''
+        # Chapter header, pages and closing tag in one write
+        page_divs = ''.join(
+            f'<div class="page-content">{page_html[page_file]}</div>' for _, page_file in pages
+        )
+        out.write(f'''
     <div class="chapter" id="section-{prefix}">
         <div class="chapter-header">
             <div class="chapter-category">{category}</div>
             <h1>{prefix}: {title}</h1>
         </div>
-''')
-
-        # Chapter pages
-        for page_num, page_file in pages:
-            content = page_file.read_text(encoding='utf-8')
-            html_content = markdown_to_html(content)
-            html_parts.append(f'<div class="page-content">{html_content}</div>')
-
-        html_parts.append('</div>')  # Close chapter
+{page_divs}</div>''')
 
     # Document footer
-    html_parts.append('''
+    out.write('''
 </body>
 </html>
 ''')
 
-    return ''.join(html_parts)
+
+def generate_html(pages_dir: Path) -> str:
+    """Generate complete HTML document from all pages."""
+    out = io.StringIO()
+    write_html(pages_dir, out)
+    return out.getvalue()
+
+
+def _pipe_to_weasyprint() -> str:
+    """Stream the HTML into the weasyprint CLI on stdin. Returns its error output, or ''."""
+    # Convert pages before weasyprint starts, so the pool's workers never
+    # inherit its stdin
+    chapters, page_html = load_chapters(PAGES_DIR)
+
+    # stderr goes to a file, so weasyprint can never block on a full pipe
+    # while we are still writing its input
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(
+            ['weasyprint', '--base-url', str(OUTPUT_DIR), '-', str(OUTPUT_PDF)],
+            stdin=subprocess.PIPE, stderr=err, bufsize=1 << 20
+        )
+        try:
+            with io.TextIOWrapper(proc.stdin, encoding='utf-8') as out:
+                write_document(chapters, page_html, out)
+        except BrokenPipeError:
+            pass  # weasyprint exited early; its stderr says why
+        if proc.wait() == 0:
+            return ''
+        err.seek(0)
+        return err.read().decode('utf-8', 'replace')
+
+
+def _stream_to_weasyprint(HTML) -> str:
+    """Render in-process, feeding weasyprint's parser through a pipe.
+
+    A writer thread streams the document into the pipe while weasyprint
+    parses it incrementally from the read end. Returns an error message,
+    or '' on success.
+    """
+    # Convert pages here, so the process pool never forks from the writer thread
+    chapters, page_html = load_chapters(PAGES_DIR)
+    read_fd, write_fd = os.pipe()
+    write_errors = []
+
+    def feed():
+        try:
+            with open(write_fd, 'w', encoding='utf-8', buffering=1 << 20) as out:
+                write_document(chapters, page_html, out)
+        except BrokenPipeError:
+            pass  # weasyprint stopped reading; its own error is reported
+        except Exception as e:
+            write_errors.append(e)
+
+    writer = threading.Thread(target=feed)
+    writer.start()
+    try:
+        with open(read_fd, 'rb') as source:
+            document = HTML(file_obj=source, encoding='utf-8', base_url=str(OUTPUT_DIR))
+    except Exception as e:
+        return str(e)
+    finally:
+        # The read end is closed by now, which unblocks the writer if parsing stopped early
+        writer.join()
+    if write_errors:
+        return str(write_errors[0])
+
+    try:
+        document.write_pdf(str(OUTPUT_PDF))
+    except Exception as e:
+        return str(e)
+    return ''
+
+
+def write_pdf(keep_html: bool = False) -> str:
+    """Render the textbook to OUTPUT_PDF. Returns an error message, or '' on success.
+
+    The HTML is streamed into weasyprint as it is written - through the CLI's
+    stdin, or a pipe into the in-process parser - and never held whole in
+    memory or written to disk. With keep_html it goes to OUTPUT_HTML instead,
+    and weasyprint renders from that file.
+    """
+    try:
+        from weasyprint import HTML
+    except ImportError:
+        HTML = None
+
+    if not keep_html:
+        return _pipe_to_weasyprint() if HTML is None else _stream_to_weasyprint(HTML)
+
+    with OUTPUT_HTML.open('w', encoding='utf-8', buffering=1 << 20) as out:
+        write_html(PAGES_DIR, out)
+
+    if HTML is None:
+        # Only the weasyprint CLI is available
+        result = subprocess.run(
+            ['weasyprint', str(OUTPUT_HTML), str(OUTPUT_PDF)],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True
+        )
+        return result.stderr if result.returncode != 0 else ''
+
+    # In-process: no interpreter startup or second weasyprint import
+    try:
+        HTML(filename=str(OUTPUT_HTML)).write_pdf(str(OUTPUT_PDF))
+    except Exception as e:
+        return str(e)
+    return ''
 
 
 def main():
-    print("Generating HTML from markdown pages...")
-    html_content = generate_html(PAGES_DIR)
-
-    # Write HTML file
-    OUTPUT_HTML.write_text(html_content, encoding='utf-8')
-    print(f"HTML written to: {OUTPUT_HTML}")
+    # --debug-html also writes the intermediate HTML for inspection
+    debug_html = '--debug-html' in sys.argv[1:]
 
-    # Generate PDF using weasyprint
+    # HTML generation streams straight into weasyprint
+    print("Generating HTML from markdown pages...")
     print("Generating PDF with weasyprint...")
-    result = subprocess.run(
-        ['weasyprint', str(OUTPUT_HTML), str(OUTPUT_PDF)],
-        capture_output=True,
-        text=True
-    )
+    error = write_pdf(keep_html=debug_html)
+
+    if debug_html:
+        print(f"HTML written to: {OUTPUT_HTML}")
 
-    if result.returncode == 0:
+    if not error:
         print(f"PDF generated: {OUTPUT_PDF}")
         # Get file size
         size_mb = OUTPUT_PDF.stat().st_size / (1024 * 1024)
         print(f"File size: {size_mb:.1f} MB")
     else:
-        print(f"Error generating PDF: {result.stderr}")
+        print(f"Error generating PDF: {error}")
         return 1
 
     return 0
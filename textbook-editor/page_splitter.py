@@ -9,8 +9,9 @@ Target: ~2,500-3,000 characters per page (adjustable for code blocks).
 import os
 import re
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, NamedTuple, Tuple
 
 # Configuration
 SOURCE_DIR = Path.home() / "projects/vvroom/textbook"
@@ -19,118 +20,168 @@ TARGET_CHARS = 2750  # Target characters per page
 MIN_CHARS = 2000     # Minimum before considering a new page
 MAX_CHARS = 3500     # Maximum before forcing a split
 
+# Flags for creating/replacing an output page
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
 
-@dataclass
-class ContentBlock:
+# Compiled patterns, shared by every line
+_RE_STEP = re.compile(r'^#+\s*Step\s+\d+\.\d+')
+_RE_PREFIX = re.compile(r'^([A-Z]?\d+)-')
+# Any line parse_content_blocks would treat as code, table, list or rule
+_RE_BLOCK_SYNTAX = re.compile(r'^\s*(?:```|\||[-*+]\s|\d+\.\s|(?:---|\*\*\*|___)\s*$)', re.MULTILINE)
+
+# Lines that are horizontal rules once stripped
+_HR_LINES = frozenset(('---', '***', '___'))
+
+
+def _is_list_item(line: str) -> bool:
+    """Check for a bullet (-, *, +) or numbered (N.) item followed by whitespace.
+
+    Plain string checks, same as matching r'^\s*(?:[-*+]|\d+\.)\s'.
+    """
+    s = line.lstrip()
+    if len(s) < 2:
+        return False
+    if s[0] in '-*+':
+        return s[1].isspace()
+    i = 0
+    while i < len(s) and s[i].isdecimal():
+        i += 1
+    return 0 < i < len(s) - 1 and s[i] == '.' and s[i + 1].isspace()
+
+
+# Block types that are a good place to start a new page
+_BREAK_TYPES = frozenset(('heading', 'hr', 'step'))
+
+
+class ContentBlock(NamedTuple):
     """A block of content that should not be split."""
     content: str
-    block_type: str  # 'heading', 'paragraph', 'code', 'table', 'list', 'hr', 'other'
+    block_type: str  # 'heading', 'paragraph', 'code', 'table', 'list', 'hr', 'step'
     char_count: int
 
     @property
     def is_break_point(self) -> bool:
         """Check if this block is a good place to start a new page."""
-        return self.block_type in ('heading', 'hr', 'step')
+        return self.block_type in _BREAK_TYPES
+
+
+def _make_block(lines: List[str], block_type: str) -> ContentBlock:
+    """Join lines into a single block of the given type."""
+    block_content = '\n'.join(lines)
+    return ContentBlock(block_content, block_type, len(block_content))
+
+
+def _parse_simple(content: str) -> List[ContentBlock]:
+    """
+    parse_content_blocks for content made only of headings and paragraphs.
+    Each heading takes its blank lines and first paragraph; the lines between
+    headings form the paragraph blocks.
+    """
+    blocks = []
+    lines = content.split('\n')
+    n = len(lines)
+    start = 0  # first line of the pending paragraph block
+
+    for h in [k for k, line in enumerate(lines) if line.startswith('#')]:
+        if h > start:
+            blocks.append(_make_block(lines[start:h], 'paragraph'))
+
+        # Heading, the blank lines after it, then its first paragraph
+        i = h + 1
+        while i < n and not lines[i].strip():
+            i += 1
+        while i < n and lines[i].strip() and not lines[i].startswith('#'):
+            i += 1
+        blocks.append(_make_block(lines[h:i], 'step' if _RE_STEP.match(lines[h]) else 'heading'))
+        start = i
+
+    if start < n:
+        block = _make_block(lines[start:], 'paragraph')
+        if block.content.strip():  # Only add if there's actual content
+            blocks.append(block)
+
+    return blocks
 
 
 def parse_content_blocks(content: str) -> List[ContentBlock]:
     """
     Parse markdown content into blocks that should not be split.
     """
+    # Substring tests rule out most documents cheaply; those left without
+    # any code, table, list or rule line skip the line-by-line state machine
+    if '```' not in content and '|' not in content and not _RE_BLOCK_SYNTAX.search(content):
+        return _parse_simple(content)
+
     blocks = []
+    add_block = blocks.append
     lines = content.split('\n')
     current_block = []
+
+    def flush(block_type: str):
+        """Emit the lines collected so far as one block, if there are any."""
+        if current_block:
+            add_block(_make_block(current_block, block_type))
+            current_block.clear()
+
     current_type = 'paragraph'
     in_code_block = False
     in_table = False
 
+    n = len(lines)
     i = 0
-    while i < len(lines):
+    while i < n:
         line = lines[i]
+        stripped = line.strip()  # once per line; every branch below tests it
 
         # Handle code blocks
-        if line.strip().startswith('```'):
+        if stripped.startswith('```'):
             if in_code_block:
                 # End of code block
                 current_block.append(line)
-                block_content = '\n'.join(current_block)
-                blocks.append(ContentBlock(
-                    content=block_content,
-                    block_type='code',
-                    char_count=len(block_content)
-                ))
-                current_block = []
+                flush('code')
                 current_type = 'paragraph'
                 in_code_block = False
+                i += 1
             else:
                 # Start of code block - flush current block first
-                if current_block:
-                    block_content = '\n'.join(current_block)
-                    blocks.append(ContentBlock(
-                        content=block_content,
-                        block_type=current_type,
-                        char_count=len(block_content)
-                    ))
-                    current_block = []
-                current_block.append(line)
+                flush(current_type)
                 current_type = 'code'
                 in_code_block = True
-            i += 1
-            continue
 
-        # If in code block, keep collecting
-        if in_code_block:
-            current_block.append(line)
-            i += 1
+                # Take the body up to the closing fence (or end of file) in
+                # one slice; the fence itself is handled on the next pass
+                j = i + 1
+                while j < n and not lines[j].strip().startswith('```'):
+                    j += 1
+                current_block.extend(lines[i:j])
+                i = j
             continue
 
         # Handle tables
-        if line.strip().startswith('|') or (line.strip().startswith('|-') or line.strip().startswith('|:')):
+        if stripped.startswith('|'):
             if not in_table:
                 # Flush current block
-                if current_block:
-                    block_content = '\n'.join(current_block)
-                    blocks.append(ContentBlock(
-                        content=block_content,
-                        block_type=current_type,
-                        char_count=len(block_content)
-                    ))
-                    current_block = []
+                flush(current_type)
                 in_table = True
                 current_type = 'table'
             current_block.append(line)
             i += 1
             continue
         elif in_table:
-            # End of table
-            block_content = '\n'.join(current_block)
-            blocks.append(ContentBlock(
-                content=block_content,
-                block_type='table',
-                char_count=len(block_content)
-            ))
-            current_block = []
+            # End of table - emitted even if empty (a code fence inside the
+            # table already flushed its lines)
+            add_block(_make_block(current_block, 'table'))
+            current_block.clear()
             in_table = False
             current_type = 'paragraph'
             # Don't increment i, process this line again
             continue
 
         # Handle horizontal rules
-        if line.strip() in ('---', '***', '___'):
+        if stripped in _HR_LINES:
             # Flush current block
-            if current_block:
-                block_content = '\n'.join(current_block)
-                blocks.append(ContentBlock(
-                    content=block_content,
-                    block_type=current_type,
-                    char_count=len(block_content)
-                ))
-                current_block = []
-            blocks.append(ContentBlock(
-                content=line,
-                block_type='hr',
-                char_count=len(line)
-            ))
+            flush(current_type)
+            add_block(ContentBlock(line, 'hr', len(line)))
             current_type = 'paragraph'
             i += 1
             continue
@@ -138,18 +189,11 @@ def parse_content_blocks(content: str) -> List[ContentBlock]:
         # Handle headings (## level as major break points)
         if line.startswith('#'):
             # Flush current block
-            if current_block:
-                block_content = '\n'.join(current_block)
-                blocks.append(ContentBlock(
-                    content=block_content,
-                    block_type=current_type,
-                    char_count=len(block_content)
-                ))
-                current_block = []
+            flush(current_type)
 
             # Check for "Step XXX.N" pattern
             heading_type = 'heading'
-            if re.match(r'^#+\s*Step\s+\d+\.\d+', line):
+            if _RE_STEP.match(line):
                 heading_type = 'step'
 
             # Collect heading with its first paragraph (keep them together)
@@ -157,55 +201,47 @@ def parse_content_blocks(content: str) -> List[ContentBlock]:
             i += 1
 
             # Skip empty lines after heading
-            while i < len(lines) and lines[i].strip() == '':
+            while i < n and not lines[i].strip():
                 heading_block.append(lines[i])
                 i += 1
 
             # Include first paragraph with heading
-            while i < len(lines) and lines[i].strip() != '' and not lines[i].startswith('#') and not lines[i].strip().startswith('```') and not lines[i].strip().startswith('|'):
-                heading_block.append(lines[i])
+            while i < n:
+                next_line = lines[i]
+                next_stripped = next_line.strip()
+                if (not next_stripped or next_line.startswith('#') or
+                        next_stripped.startswith(('```', '|'))):
+                    break
+                heading_block.append(next_line)
                 i += 1
 
-            block_content = '\n'.join(heading_block)
-            blocks.append(ContentBlock(
-                content=block_content,
-                block_type=heading_type,
-                char_count=len(block_content)
-            ))
+            add_block(_make_block(heading_block, heading_type))
             current_type = 'paragraph'
             continue
 
         # Handle lists (keep entire list together)
-        if re.match(r'^[\s]*[-*+]\s', line) or re.match(r'^[\s]*\d+\.\s', line):
+        if _is_list_item(line):
             # Flush current block
-            if current_block:
-                block_content = '\n'.join(current_block)
-                blocks.append(ContentBlock(
-                    content=block_content,
-                    block_type=current_type,
-                    char_count=len(block_content)
-                ))
-                current_block = []
+            flush(current_type)
 
             # Collect the entire list
             list_block = [line]
             i += 1
-            while i < len(lines):
+            while i < n:
                 next_line = lines[i]
+                next_blank = not next_line.strip()
                 # Continue list if: bullet/numbered item, continuation (indented), or blank within list
-                if (re.match(r'^[\s]*[-*+]\s', next_line) or
-                    re.match(r'^[\s]*\d+\.\s', next_line) or
-                    (next_line.startswith('  ') and next_line.strip()) or
-                    next_line.strip() == ''):
+                if next_blank or next_line.startswith('  ') or _is_list_item(next_line):
                     # Check if blank line is within list (next non-blank is still list)
-                    if next_line.strip() == '':
-                        # Look ahead
+                    if next_blank:
+                        # Look ahead once for the whole run of blanks - every
+                        # blank in it sees the same next non-blank line
                         j = i + 1
-                        while j < len(lines) and lines[j].strip() == '':
+                        while j < n and not lines[j].strip():
                             j += 1
-                        if j < len(lines) and (re.match(r'^[\s]*[-*+]\s', lines[j]) or re.match(r'^[\s]*\d+\.\s', lines[j])):
-                            list_block.append(next_line)
-                            i += 1
+                        if j < n and _is_list_item(lines[j]):
+                            list_block.extend(lines[i:j])
+                            i = j
                             continue
                         else:
                             break
@@ -214,38 +250,20 @@ def parse_content_blocks(content: str) -> List[ContentBlock]:
                 else:
                     break
 
-            block_content = '\n'.join(list_block)
-            blocks.append(ContentBlock(
-                content=block_content,
-                block_type='list',
-                char_count=len(block_content)
-            ))
+            add_block(_make_block(list_block, 'list'))
             current_type = 'paragraph'
             continue
 
-        # Empty line - might be end of paragraph
-        if line.strip() == '':
-            if current_block:
-                current_block.append(line)
-            else:
-                # Leading blank, just add to create proper spacing
-                current_block.append(line)
-            i += 1
-            continue
-
-        # Regular paragraph content
+        # Regular paragraph content, or an empty line - kept either way, as
+        # a leading blank gives proper spacing
         current_block.append(line)
         i += 1
 
     # Flush remaining block
     if current_block:
-        block_content = '\n'.join(current_block)
-        if block_content.strip():  # Only add if there's actual content
-            blocks.append(ContentBlock(
-                content=block_content,
-                block_type=current_type if not in_code_block else 'code',
-                char_count=len(block_content)
-            ))
+        block = _make_block(current_block, current_type if not in_code_block else 'code')
+        if block.content.strip():  # Only add if there's actual content
+            add_block(block)
 
     return blocks
 
@@ -255,7 +273,7 @@ def split_into_pages(blocks: List[ContentBlock], source_file: str) -> List[str]:
     Group blocks into pages of approximately TARGET_CHARS characters.
     """
     pages = []
-    current_page = []
+    current_page = []  # block contents, joined once per page
     current_chars = 0
 
     for i, block in enumerate(blocks):
@@ -268,7 +286,7 @@ def split_into_pages(blocks: List[ContentBlock], source_file: str) -> List[str]:
         if current_chars == 0:
             # First block of page, always add
             pass
-        elif block.is_break_point and current_chars >= MIN_CHARS:
+        elif block.block_type in _BREAK_TYPES and current_chars >= MIN_CHARS:
             # Good break point and we have enough content
             should_break = True
         elif potential_chars > MAX_CHARS and current_chars >= MIN_CHARS:
@@ -280,19 +298,17 @@ def split_into_pages(blocks: List[ContentBlock], source_file: str) -> List[str]:
 
         if should_break and current_page:
             # Save current page and start new one
-            page_content = '\n'.join(b.content for b in current_page)
-            pages.append(page_content.strip())
+            pages.append('\n'.join(current_page).strip())
             current_page = []
             current_chars = 0
 
         # Add block to current page
-        current_page.append(block)
+        current_page.append(block.content)
         current_chars += block.char_count
 
     # Don't forget the last page
     if current_page:
-        page_content = '\n'.join(b.content for b in current_page)
-        pages.append(page_content.strip())
+        pages.append('\n'.join(current_page).strip())
 
     return pages
 
@@ -300,7 +316,10 @@ def split_into_pages(blocks: List[ContentBlock], source_file: str) -> List[str]:
 def extract_prefix(filename: str) -> str:
     """Extract the numeric prefix from a filename."""
     # Handle patterns like "000-", "051-", "A01-"
-    match = re.match(r'^([A-Z]?\d+)-', filename)
+    if filename[3:4] == '-' and filename[:3].isdecimal():
+        # The common three-digit case, without entering the regex engine
+        return filename[:3]
+    match = _RE_PREFIX.match(filename)
     if match:
         return match.group(1)
     return filename.split('-')[0]
@@ -311,7 +330,10 @@ def process_file(source_path: Path, output_dir: Path) -> Tuple[str, int]:
     Process a single markdown file and split it into pages.
     Returns (filename, page_count).
     """
-    content = source_path.read_text(encoding='utf-8')
+    # One decode from bytes; newlines translated as read_text() would
+    content = source_path.read_bytes().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
     prefix = extract_prefix(source_path.name)
 
     # Parse into blocks
@@ -320,11 +342,18 @@ def process_file(source_path: Path, output_dir: Path) -> Tuple[str, int]:
     # Split into pages
     pages = split_into_pages(blocks, source_path.name)
 
-    # Write output files
-    for i, page_content in enumerate(pages, 1):
-        output_filename = f"{prefix}-p{i:02d}.md"
-        output_path = output_dir / output_filename
-        output_path.write_text(page_content, encoding='utf-8')
+    # Write output files - straight to file descriptors, no file objects
+    encoded = [page_content.encode('utf-8') for page_content in pages]
+    base = os.path.join(output_dir, prefix)
+    os_open, os_write, os_close = os.open, os.write, os.close
+    for i, data in enumerate(encoded, 1):
+        fd = os_open(f"{base}-p{i:02d}.md", _WRITE_FLAGS, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os_write(fd, view):]
+        finally:
+            os_close(fd)
 
     return source_path.name, len(pages)
 
@@ -344,33 +373,36 @@ def main():
     print(f"Processing {len(source_files)} source files...")
     print("-" * 60)
 
-    total_pages = 0
-    results = []
+    # Files are independent - split them across CPU cores, in order
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(process_file, source_files, repeat(OUTPUT_DIR)))
+    total_pages = sum(page_count for _, page_count in results)
+    file_lines = [f"{filename}: {page_count} pages" for filename, page_count in results]
+    summary = [
+        f"Total: {len(source_files)} files -> {total_pages} pages",
+        f"Average: {total_pages / len(source_files):.1f} pages per file",
+    ]
 
-    for source_file in source_files:
-        filename, page_count = process_file(source_file, OUTPUT_DIR)
-        results.append((filename, page_count))
-        total_pages += page_count
-        print(f"{filename}: {page_count} pages")
-
-    print("-" * 60)
-    print(f"Total: {len(source_files)} files -> {total_pages} pages")
-    print(f"Average: {total_pages / len(source_files):.1f} pages per file")
+    # Progress and summary in a single write
+    print('\n'.join(file_lines + ["-" * 60] + summary))
 
-    # Write summary report
+    # Write summary report in one go
     report_path = OUTPUT_DIR / "SPLIT_REPORT.txt"
-    with open(report_path, 'w') as f:
-        f.write("Textbook Page Splitter Report\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(f"Source: {SOURCE_DIR}\n")
-        f.write(f"Output: {OUTPUT_DIR}\n")
-        f.write(f"Target characters per page: {TARGET_CHARS}\n\n")
-        f.write("-" * 60 + "\n")
-        for filename, page_count in results:
-            f.write(f"{filename}: {page_count} pages\n")
-        f.write("-" * 60 + "\n")
-        f.write(f"\nTotal: {len(source_files)} files -> {total_pages} pages\n")
-        f.write(f"Average: {total_pages / len(source_files):.1f} pages per file\n")
+    report_lines = [
+        "Textbook Page Splitter Report",
+        "=" * 60,
+        "",
+        f"Source: {SOURCE_DIR}",
+        f"Output: {OUTPUT_DIR}",
+        f"Target characters per page: {TARGET_CHARS}",
+        "",
+        "-" * 60,
+        *file_lines,
+        "-" * 60,
+        "",
+        *summary,
+    ]
+    report_path.write_bytes(('\n'.join(report_lines) + '\n').encode('utf-8'))
 
     print(f"\nReport written to: {report_path}")
 
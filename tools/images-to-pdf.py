@@ -17,9 +17,10 @@ Usage:
 
 import sys
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
-from io import BytesIO
 
 try:
     from reportlab.lib.pagesizes import LETTER
@@ -41,63 +42,128 @@ USABLE_HEIGHT = PAGE_HEIGHT - (2 * MARGIN)
 # Spacing between images on the same page
 IMAGE_SPACING = 0.25 * inch
 
+# Widest a JPEG is decoded - about 2 pixels per point of usable width.
+# Larger ones are decoded at 1/2, 1/4 or 1/8 scale.
+MAX_DECODE_WIDTH = int(USABLE_WIDTH * 2)
+
+# Smallest scale accepted to fit an image on one page (shrink by up to 20%)
+SHRINK_FACTOR = 0.8
+
+# Tallest height/width ratios that fit one page at full width, and with shrinking
+_RATIO_MAX_FIT = USABLE_HEIGHT / USABLE_WIDTH
+_RATIO_MAX_SHRINK = USABLE_HEIGHT / (USABLE_WIDTH * SHRINK_FACTOR)
+
 # Supported image extensions
 IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp', '.tiff', '.tif'}
 
 
 def get_image_files(directory: Path) -> list[Path]:
     """Get all image files from directory, sorted by name."""
+    # scandir's is_file() answers from the directory entry, without a stat per file
     files = []
-    for f in directory.iterdir():
-        if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS:
-            files.append(f)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                files.append(Path(entry.path))
     return sorted(files, key=lambda x: x.name.lower())
 
 
-def calculate_scaled_dimensions(img_width: int, img_height: int, max_width: float, max_height: float | None = None) -> tuple[float, float]:
+def prepare_image(img_path: Path) -> tuple[int, list[tuple]]:
     """
-    Scale image to fit within max dimensions while maintaining aspect ratio.
-    If max_height is None, only constrain by width.
+    Open, convert and slice one image ready for drawing (runs in a worker thread).
+    Returns (total_pages, pages), each page being (image, x, y, width, height, indicator)
+    where indicator is the page label for split images, else None.
     """
-    # Scale to fit width
-    scale = max_width / img_width
-    scaled_width = max_width
-    scaled_height = img_height * scale
-
-    # If height constraint exists and we exceed it, scale down further
-    if max_height is not None and scaled_height > max_height:
-        scale = max_height / img_height
-        scaled_height = max_height
-        scaled_width = img_width * scale
-
-    return scaled_width, scaled_height
-
-
-def can_fit_with_shrink(img_width: int, img_height: int, shrink_factor: float = 0.8) -> tuple[bool, float, float]:
-    """
-    Check if image can fit on one page with up to 20% shrink (shrink_factor=0.8).
-    Returns (can_fit, scaled_width, scaled_height).
-    """
-    # First scale to fit the usable width
-    scaled_width, scaled_height = calculate_scaled_dimensions(
-        img_width, img_height, USABLE_WIDTH
-    )
-
-    # If it fits at full size, great
-    if scaled_height <= USABLE_HEIGHT:
-        return True, scaled_width, scaled_height
-
-    # Try shrinking up to 20%
-    min_scale = shrink_factor
-    required_scale = USABLE_HEIGHT / scaled_height
-
-    if required_scale >= min_scale:
-        # We can fit it with acceptable shrinking
-        final_width = scaled_width * required_scale
-        final_height = USABLE_HEIGHT
-        return True, final_width, final_height
-
-    return False, scaled_width, scaled_height
+    with Image.open(img_path) as img:
+        # Let libjpeg downscale oversized JPEGs while decoding
+        # (a no-op for other formats); img.size reflects the result
+        draft_width = min(img.width, MAX_DECODE_WIDTH)
+        img.draft('RGB', (draft_width, max(1, img.height * draft_width // img.width)))
+
+        # Untouched RGB images can be drawn straight from the file
+        converted = img.mode != 'RGB'
+
+        # Convert to RGB if necessary (for PNG with transparency, etc.)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            # Create white background
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+            img = background
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+
+        img_width, img_height = img.size
+
+        # Check if image can fit on one page (with up to 20% shrink) -
+        # settled by its aspect ratio alone
+        ratio = img_height / img_width
+        can_fit = ratio <= _RATIO_MAX_SHRINK
+        if ratio <= _RATIO_MAX_FIT or not can_fit:
+            # Scale to fit the usable width
+            scaled_width = USABLE_WIDTH
+            scaled_height = img_height * (USABLE_WIDTH / img_width)
+        else:
+            # We can fit it with acceptable shrinking
+            scaled_width = USABLE_HEIGHT / ratio
+            scaled_height = USABLE_HEIGHT
+
+        if can_fit:
+            # Image fits on one page
+            x = MARGIN + (USABLE_WIDTH - scaled_width) / 2  # Center horizontally
+            y = PAGE_HEIGHT - MARGIN - scaled_height  # Top of usable area
+
+            if converted:
+                # Hand ReportLab the converted pixels directly - it
+                # compresses them itself, so encoding a PNG first is wasted
+                image = ImageReader(img)
+            else:
+                # Pass the file itself - ReportLab embeds JPEGs as-is,
+                # with no decode/re-encode round trip
+                image = str(img_path)
+
+            return 1, [(image, x, y, scaled_width, scaled_height, None)]
+
+        # Image needs to span multiple pages, scaled to fit width only
+        # Calculate how many pages we need
+        total_pages = int((scaled_height + USABLE_HEIGHT - 1) // USABLE_HEIGHT)
+
+        # We need to crop the original image into sections
+        # Work backwards from scaled dimensions to original crop regions
+        scale_factor = scaled_width / img_width
+
+        remaining_height = scaled_height
+        crop_y_start = 0  # In original image coordinates
+
+        pages = []
+        page_num = 0
+        while remaining_height > 0:
+            page_num += 1
+            # How much scaled height to show on this page
+            this_page_height = min(remaining_height, USABLE_HEIGHT)
+
+            # Convert back to original image coordinates for cropping
+            crop_height_original = this_page_height / scale_factor
+            crop_y_end = min(crop_y_start + crop_height_original, img_height)
+
+            # Crop the section - a copy of rows from the image
+            # decoded once above, handed to ReportLab unencoded
+            cropped = img.crop((0, int(crop_y_start), img_width, int(crop_y_end)))
+
+            # Calculate position - center horizontally, start from top
+            x = MARGIN + (USABLE_WIDTH - scaled_width) / 2
+            actual_height = (crop_y_end - crop_y_start) * scale_factor
+            y = PAGE_HEIGHT - MARGIN - actual_height
+
+            # Page indicator for split images
+            indicator = f"{img_path.name} ({page_num}/{total_pages})" if total_pages > 1 else None
+            pages.append((ImageReader(cropped), x, y, scaled_width, actual_height, indicator))
+
+            crop_y_start = crop_y_end
+            remaining_height -= this_page_height
+
+        return total_pages, pages
 
 
 def create_pdf(image_dir: Path, output_path: Path):
@@ -112,101 +178,39 @@ def create_pdf(image_dir: Path, output_path: Path):
 
     c = canvas.Canvas(str(output_path), pagesize=LETTER)
 
-    for i, img_path in enumerate(image_files):
-        print(f"  [{i+1}/{len(image_files)}] Processing: {img_path.name}")
-
-        try:
-            with Image.open(img_path) as img:
-                # Convert to RGB if necessary (for PNG with transparency, etc.)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    # Create white background
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-
-                img_width, img_height = img.size
-
-                # Check if image can fit on one page (with up to 20% shrink)
-                can_fit, scaled_width, scaled_height = can_fit_with_shrink(img_width, img_height)
-
-                if can_fit:
-                    # Image fits on one page
-                    x = MARGIN + (USABLE_WIDTH - scaled_width) / 2  # Center horizontally
-                    y = PAGE_HEIGHT - MARGIN - scaled_height  # Top of usable area
-
-                    # Save image to bytes for ReportLab
-                    img_buffer = BytesIO()
-                    img.save(img_buffer, format='PNG')
-                    img_buffer.seek(0)
-
-                    c.drawImage(ImageReader(img_buffer), x, y,
-                               width=scaled_width, height=scaled_height)
-                    c.showPage()
-
-                else:
-                    # Image needs to span multiple pages
-                    # Scale to fit width only
-                    scaled_width, scaled_height = calculate_scaled_dimensions(
-                        img_width, img_height, USABLE_WIDTH
-                    )
-
-                    # Calculate how many pages we need
-                    total_pages = int((scaled_height + USABLE_HEIGHT - 1) // USABLE_HEIGHT)
-
-                    # We need to crop the original image into sections
-                    # Work backwards from scaled dimensions to original crop regions
-                    scale_factor = scaled_width / img_width
+    # Images are opened and converted in worker threads (PIL releases the
+    # GIL while decoding); the canvas is only drawn on here, in file order.
+    # At most `workers` images are prepared ahead, bounding memory use.
+    workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(executor.submit(prepare_image, f) for f in image_files[:workers])
 
-                    remaining_height = scaled_height
-                    crop_y_start = 0  # In original image coordinates
+        for i, img_path in enumerate(image_files):
+            future = pending.popleft()
+            if i + workers < len(image_files):
+                pending.append(executor.submit(prepare_image, image_files[i + workers]))
 
-                    page_num = 0
-                    while remaining_height > 0:
-                        page_num += 1
-                        # How much scaled height to show on this page
-                        this_page_height = min(remaining_height, USABLE_HEIGHT)
+            print(f"  [{i+1}/{len(image_files)}] Processing: {img_path.name}")
 
-                        # Convert back to original image coordinates for cropping
-                        crop_height_original = this_page_height / scale_factor
-                        crop_y_end = min(crop_y_start + crop_height_original, img_height)
+            try:
+                total_pages, pages = future.result()
 
-                        # Crop the section
-                        cropped = img.crop((0, int(crop_y_start), img_width, int(crop_y_end)))
+                for image, x, y, width, height, indicator in pages:
+                    c.drawImage(image, x, y, width=width, height=height)
 
-                        # Save cropped section to bytes
-                        img_buffer = BytesIO()
-                        cropped.save(img_buffer, format='PNG')
-                        img_buffer.seek(0)
+                    if indicator is not None:
+                        c.setFont("Helvetica", 8)
+                        c.setFillColorRGB(0.5, 0.5, 0.5)
+                        c.drawRightString(PAGE_WIDTH - MARGIN, MARGIN / 2, indicator)
 
-                        # Calculate position - center horizontally, start from top
-                        x = MARGIN + (USABLE_WIDTH - scaled_width) / 2
-                        actual_height = (crop_y_end - crop_y_start) * scale_factor
-                        y = PAGE_HEIGHT - MARGIN - actual_height
-
-                        c.drawImage(ImageReader(img_buffer), x, y,
-                                   width=scaled_width, height=actual_height)
-
-                        # Add page indicator for split images
-                        if total_pages > 1:
-                            c.setFont("Helvetica", 8)
-                            c.setFillColorRGB(0.5, 0.5, 0.5)
-                            indicator = f"{img_path.name} ({page_num}/{total_pages})"
-                            c.drawRightString(PAGE_WIDTH - MARGIN, MARGIN / 2, indicator)
-
-                        c.showPage()
-
-                        crop_y_start = crop_y_end
-                        remaining_height -= this_page_height
+                    c.showPage()
 
+                if total_pages > 1:
                     print(f"    → Split across {total_pages} pages")
 
-        except Exception as e:
-            print(f"  Error processing {img_path.name}: {e}")
-            continue
+            except Exception as e:
+                print(f"  Error processing {img_path.name}: {e}")
+                continue
 
     c.save()
     print(f"\nCreated: {output_path}")
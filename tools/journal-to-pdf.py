@@ -18,8 +18,11 @@ Usage:
     python journal-to-pdf.py quality-journal.md ../e2e/screenshots TEST-PLAN.pdf
 """
 
+import os
 import sys
 import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 from io import BytesIO
@@ -52,6 +55,70 @@ USABLE_HEIGHT = PAGE_HEIGHT - (2 * MARGIN)
 # Supported image extensions
 IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
 
+# PNG signature followed by the IHDR chunk header
+_PNG_HEAD = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR'
+
+# Compiled patterns, shared by every entry
+# Entry header: YYYY-MM-DD_HH:MM:SS alone on a line
+_RE_TIMESTAMP = re.compile(r'^[^\S\n]*(\d{4}-\d{2}-\d{2}_\d{2}:\d{2}:\d{2})[^\S\n]*$', re.MULTILINE)
+# Lines repeating the Action Log heading, which never belong to an entry
+_RE_ACTION_LOG_LINE = re.compile(r'^.*## Action Log.*\n?', re.MULTILINE)
+_RE_TEST_ID = re.compile(r'\b([VUP][\d.]+)\b')
+_RE_EXPLICIT_SCREENSHOT = re.compile(r'Screenshot:\s*(\S+\.png)', re.IGNORECASE)
+_RE_PNG = re.compile(r'([a-zA-Z0-9_-]+\.png)')
+# Test IDs and PASS/FAIL verdicts, highlighted in one pass
+_RE_MARKUP = re.compile(r'PASS|FAIL|\b[VUP][\d.]+\b')
+
+# ReportLab paragraph escaping in a single translate pass
+_MARKUP_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\n': '<br/>'})
+
+_VERDICT_MARKUP = {
+    'PASS': '<font color="green"><b>PASS</b></font>',
+    'FAIL': '<font color="red"><b>FAIL</b></font>',
+}
+
+# Screenshots each test ID is expected to have captured
+_TEST_ID_SCREENSHOTS: dict[str, tuple[str, ...]] = {
+    'V1.1.1': ('results-table-default.png',),
+    'V1.1.2': ('filter-panel-default.png',),
+    'V1.1.3': ('pagination-default.png',),
+    'V1.1.4': ('statistics-default.png',),
+    'V1.1.5': ('search-default.png',),
+    'V1.2.1': ('results-table-filtered-ford.png',),
+    'V1.2.2': ('results-table-filtered-suv.png',),
+    'V1.2.3': ('results-table-filtered-recent.png',),
+    'V1.2.4': ('statistics-filtered-chevrolet.png',),
+    'V1.2.5': ('results-table-model-combos.png',),
+    'V1.3.1': ('statistics-highlight-tesla.png',),
+    'V1.3.2': ('statistics-highlight-years.png',),
+    'V1.3.3': ('statistics-highlight-pickup.png',),
+    'V1.3.4': ('statistics-filter-with-highlight.png',),
+    'V1.4.1': ('results-table-sorted-year-desc.png',),
+    'V1.4.2': ('results-table-sorted-manufacturer-asc.png',),
+    'V1.4.3': ('results-table-sorted-instancecount-desc.png',),
+    'V1.5.1': ('results-table-paginated-page2.png',),
+    'V1.5.2': ('pagination-page5.png',),
+    'V1.5.3': ('results-table-last-page.png',),
+    'U2.1.1': ('url-state-manufacturer-ford.png',),
+    'U2.1.2': ('url-state-year-range.png',),
+    'U2.1.3': ('url-state-bodyclass-pickup.png',),
+    'U2.1.4': ('url-state-pagination.png',),
+    'U2.1.5': ('url-state-sort-year-desc.png',),
+    'U2.1.6': ('url-state-highlight-tesla.png',),
+    'U2.1.7': ('url-state-filter-plus-highlight.png',),
+    'U2.1.8': ('url-state-model-combos.png',),
+    'U2.2.1': ('state-url-manufacturer-dodge.png',),
+    'U2.2.2': ('state-url-year-range.png',),
+    'U2.2.3': ('state-url-bodyclass-suv.png',),
+    'U2.2.4': ('state-url-page4.png',),
+    'U2.2.5': ('state-url-size50.png',),
+    'U2.2.6': ('state-url-sort-year.png',),
+    'U2.2.9': ('state-url-cleared.png',),
+    'U2.3.1': ('combined-filters-ford-coupe-recent.png',),
+    'U2.3.2': ('combined-filter-sort-page.png',),
+    'U2.3.3': ('combined-filter-highlight.png',),
+}
+
 
 @dataclass
 class JournalEntry:
@@ -63,150 +130,94 @@ class JournalEntry:
     is_category_complete: bool = False
 
 
-def find_screenshots_in_text(text: str, screenshots_dir: Path) -> list[str]:
-    """Find all screenshot references in text that exist in the screenshots directory."""
-    found = []
+def find_screenshots_in_text(text: str, screenshots_dir: Path, existing: frozenset[str]) -> list[str]:
+    """Find all screenshot references in text that exist in the screenshots directory.
+
+    ``existing`` is the directory listing, so plain filenames need no stat();
+    only references with a path component are checked on disk.
+    """
+    # Every reference ends in .png (any case for explicit ones); most entries have none
+    if '.png' not in text and '.png' not in text.lower():
+        return []
 
     # Pattern 1: Explicit "Screenshot: filename.png"
-    explicit_matches = re.findall(r'Screenshot:\s*(\S+\.png)', text, re.IGNORECASE)
-    found.extend(explicit_matches)
+    found = _RE_EXPLICIT_SCREENSHOT.findall(text)
+    seen = set(found)
 
     # Pattern 2: Any .png filename mentioned
-    png_matches = re.findall(r'([a-zA-Z0-9_-]+\.png)', text)
+    png_matches = _RE_PNG.findall(text)
     for match in png_matches:
-        if match not in found:
+        if match not in seen:
+            seen.add(match)
             found.append(match)
 
-    # Verify files exist
+    # Verify files exist; interned, as the same names recur across entries
     verified = []
     for filename in found:
-        if (screenshots_dir / filename).exists():
-            verified.append(filename)
+        if filename in existing or ('/' in filename and (screenshots_dir / filename).exists()):
+            verified.append(sys.intern(filename))
 
     return verified
 
 
-def infer_screenshots_for_test(test_id: str, test_text: str, screenshots_dir: Path) -> list[str]:
-    """Infer likely screenshots for a test based on test ID and content."""
-    inferred = []
-    available = {f.name for f in screenshots_dir.iterdir() if f.suffix.lower() == '.png'}
-
-    # Map test IDs to screenshot patterns
-    patterns = {
-        'V1.1.1': ['results-table-default.png'],
-        'V1.1.2': ['filter-panel-default.png'],
-        'V1.1.3': ['pagination-default.png'],
-        'V1.1.4': ['statistics-default.png'],
-        'V1.1.5': ['search-default.png'],
-        'V1.2.1': ['results-table-filtered-ford.png'],
-        'V1.2.2': ['results-table-filtered-suv.png'],
-        'V1.2.3': ['results-table-filtered-recent.png'],
-        'V1.2.4': ['statistics-filtered-chevrolet.png'],
-        'V1.2.5': ['results-table-model-combos.png'],
-        'V1.3.1': ['statistics-highlight-tesla.png'],
-        'V1.3.2': ['statistics-highlight-years.png'],
-        'V1.3.3': ['statistics-highlight-pickup.png'],
-        'V1.3.4': ['statistics-filter-with-highlight.png'],
-        'V1.4.1': ['results-table-sorted-year-desc.png'],
-        'V1.4.2': ['results-table-sorted-manufacturer-asc.png'],
-        'V1.4.3': ['results-table-sorted-instancecount-desc.png'],
-        'V1.5.1': ['results-table-paginated-page2.png'],
-        'V1.5.2': ['pagination-page5.png'],
-        'V1.5.3': ['results-table-last-page.png'],
-        'U2.1.1': ['url-state-manufacturer-ford.png'],
-        'U2.1.2': ['url-state-year-range.png'],
-        'U2.1.3': ['url-state-bodyclass-pickup.png'],
-        'U2.1.4': ['url-state-pagination.png'],
-        'U2.1.5': ['url-state-sort-year-desc.png'],
-        'U2.1.6': ['url-state-highlight-tesla.png'],
-        'U2.1.7': ['url-state-filter-plus-highlight.png'],
-        'U2.1.8': ['url-state-model-combos.png'],
-        'U2.2.1': ['state-url-manufacturer-dodge.png'],
-        'U2.2.2': ['state-url-year-range.png'],
-        'U2.2.3': ['state-url-bodyclass-suv.png'],
-        'U2.2.4': ['state-url-page4.png'],
-        'U2.2.5': ['state-url-size50.png'],
-        'U2.2.6': ['state-url-sort-year.png'],
-        'U2.2.9': ['state-url-cleared.png'],
-        'U2.3.1': ['combined-filters-ford-coupe-recent.png'],
-        'U2.3.2': ['combined-filter-sort-page.png'],
-        'U2.3.3': ['combined-filter-highlight.png'],
-    }
-
-    if test_id in patterns:
-        for p in patterns[test_id]:
-            if p in available:
-                inferred.append(p)
-
-    return inferred
+def infer_screenshots_for_test(test_id: str, test_text: str, available: frozenset[str]) -> list[str]:
+    """Infer likely screenshots for a test based on test ID and content.
+
+    ``available`` holds the .png filenames in the screenshots directory.
+    """
+    return [p for p in _TEST_ID_SCREENSHOTS.get(test_id, ()) if p in available]
 
 
 def parse_journal(journal_path: Path, screenshots_dir: Path) -> list[JournalEntry]:
     """Parse the journal file and extract entries with their screenshots."""
-    content = journal_path.read_text()
+    # One decode from bytes; newlines translated as read_text() would
+    content = journal_path.read_bytes().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
     entries = []
 
-    # Split into sections by timestamp pattern
-    # Pattern: YYYY-MM-DD_HH:MM:SS at start of line
-    timestamp_pattern = r'^(\d{4}-\d{2}-\d{2}_\d{2}:\d{2}:\d{2})\s*$'
-
-    lines = content.split('\n')
-    current_entry = None
-    current_content = []
-    in_action_log = False
-
-    for i, line in enumerate(lines):
-        # Track when we enter the Action Log section
-        if '## Action Log' in line:
-            in_action_log = True
-            continue
-
-        if not in_action_log:
-            continue
-
-        timestamp_match = re.match(timestamp_pattern, line.strip())
-
-        if timestamp_match:
-            # Save previous entry if exists
-            if current_entry:
-                content_text = '\n'.join(current_content).strip()
-                current_entry.content = content_text
-                current_entry.screenshots = find_screenshots_in_text(content_text, screenshots_dir)
-
-                # Check for category completion markers
-                if '=== CATEGORY' in content_text and 'COMPLETE ===' in content_text:
-                    current_entry.is_category_complete = True
-
-                # Infer screenshots for tests mentioned
-                test_ids = re.findall(r'\b([VUP][\d.]+)\b', content_text)
-                for test_id in test_ids:
-                    inferred = infer_screenshots_for_test(test_id, content_text, screenshots_dir)
-                    for s in inferred:
-                        if s not in current_entry.screenshots:
-                            current_entry.screenshots.append(s)
-
-                entries.append(current_entry)
-
-            # Start new entry
-            current_entry = JournalEntry(timestamp=timestamp_match.group(1), content='')
-            current_content = []
-        elif current_entry:
-            current_content.append(line)
-
-    # Don't forget the last entry
-    if current_entry:
-        content_text = '\n'.join(current_content).strip()
+    # List the screenshots directory once for every entry and test ID
+    with os.scandir(screenshots_dir) as it:
+        existing = frozenset(e.name for e in it)
+    # .png by Path.suffix rules, under which a bare '.png' has no suffix
+    available = frozenset(n for n in existing if len(n) > 4 and n[-4:].lower() == '.png')
+
+    # Entries start on the line after the first Action Log heading
+    _, heading, log = content.partition('## Action Log')
+    if not heading:
+        return entries
+    log = log.partition('\n')[2]
+    if '## Action Log' in log:
+        log = _RE_ACTION_LOG_LINE.sub('', log)
+
+    # Each entry runs from its timestamp line to the next one, the last to the end
+    matches = list(_RE_TIMESTAMP.finditer(log))
+    ends = [m.start() for m in matches[1:]]
+    ends.append(len(log))
+    last = matches[-1] if matches else None
+
+    for match, end in zip(matches, ends):
+        current_entry = JournalEntry(timestamp=match.group(1), content='')
+        content_text = log[match.end():end].strip()
         current_entry.content = content_text
-        current_entry.screenshots = find_screenshots_in_text(content_text, screenshots_dir)
-
-        if '=== CATEGORY' in content_text or '=== ALL CATEGORIES' in content_text:
+        current_entry.screenshots = find_screenshots_in_text(content_text, screenshots_dir, existing)
+
+        # Check for category completion markers; the closing entry also
+        # counts the all-categories summary
+        if match is last:
+            if '=== CATEGORY' in content_text or '=== ALL CATEGORIES' in content_text:
+                current_entry.is_category_complete = True
+        elif '=== CATEGORY' in content_text and 'COMPLETE ===' in content_text:
             current_entry.is_category_complete = True
 
-        test_ids = re.findall(r'\b([VUP][\d.]+)\b', content_text)
+        # Infer screenshots for tests mentioned
+        test_ids = _RE_TEST_ID.findall(content_text)
+        seen = set(current_entry.screenshots)
         for test_id in test_ids:
-            inferred = infer_screenshots_for_test(test_id, content_text, screenshots_dir)
+            inferred = infer_screenshots_for_test(test_id, content_text, available)
             for s in inferred:
-                if s not in current_entry.screenshots:
+                if s not in seen:
+                    seen.add(s)
                     current_entry.screenshots.append(s)
 
         entries.append(current_entry)
@@ -214,27 +225,42 @@ def parse_journal(journal_path: Path, screenshots_dir: Path) -> list[JournalEntr
     return entries
 
 
+def _image_size(img_path: Path) -> tuple[int, int]:
+    """Return (width, height), read from the IHDR chunk for PNG files."""
+    with open(img_path, 'rb') as f:
+        head = f.read(24)
+    if head[:16] == _PNG_HEAD:
+        return struct.unpack('>II', head[16:24])
+    with Image.open(img_path) as img:
+        return img.size
+
+
 def create_image_flowable(img_path: Path, max_width: float, max_height: float):
     """Create a ReportLab Image flowable that fits within constraints."""
-    with Image.open(img_path) as img:
-        img_width, img_height = img.size
+    img_width, img_height = _image_size(img_path)
 
-        # Calculate scale to fit width
-        scale = min(max_width / img_width, max_height / img_height)
+    # Calculate scale to fit width
+    scale = min(max_width / img_width, max_height / img_height)
 
-        # Allow up to 20% shrink beyond width-fit to avoid splitting
-        width_scale = max_width / img_width
-        scaled_height_at_width = img_height * width_scale
+    # Allow up to 20% shrink beyond width-fit to avoid splitting
+    width_scale = max_width / img_width
+    scaled_height_at_width = img_height * width_scale
 
-        if scaled_height_at_width <= max_height * 1.25:  # Can fit with up to 20% shrink
-            final_scale = min(width_scale, max_height / img_height)
-        else:
-            final_scale = width_scale
+    if scaled_height_at_width <= max_height * 1.25:  # Can fit with up to 20% shrink
+        final_scale = min(width_scale, max_height / img_height)
+    else:
+        final_scale = width_scale
+
+    final_width = img_width * final_scale
+    final_height = img_height * final_scale
+
+    return RLImage(str(img_path), width=final_width, height=final_height)
 
-        final_width = img_width * final_scale
-        final_height = img_height * final_scale
 
-        return RLImage(str(img_path), width=final_width, height=final_height)
+def _markup_html(match) -> str:
+    """Colour a PASS/FAIL verdict, or embolden a test ID."""
+    token = match.group()
+    return _VERDICT_MARKUP.get(token) or f'<b>{token}</b>'
 
 
 def create_pdf(entries: list[JournalEntry], screenshots_dir: Path, output_path: Path, title: str):
@@ -277,6 +303,13 @@ def create_pdf(entries: list[JournalEntry], screenshots_dir: Path, output_path:
         leading=14
     )
 
+    # Timestamp and content of a plain entry, set as one paragraph
+    entry_style = ParagraphStyle(
+        'Entry',
+        parent=content_style,
+        spaceBefore=15
+    )
+
     category_style = ParagraphStyle(
         'Category',
         parent=styles['Heading2'],
@@ -297,51 +330,55 @@ def create_pdf(entries: list[JournalEntry], screenshots_dir: Path, output_path:
         spaceAfter=15
     )
 
-    # Build document content
-    story = []
-
-    # Title page
-    story.append(Spacer(1, 2*inch))
-    story.append(Paragraph(title, title_style))
-    story.append(Spacer(1, 0.5*inch))
-    story.append(Paragraph("VVroom Application Test Report", styles['Heading2']))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph(f"Generated from: {screenshots_dir.parent.name}/quality-journal.md", content_style))
-    story.append(Paragraph(f"Screenshots: {len(list(screenshots_dir.glob('*.png')))} images", content_style))
-    story.append(Paragraph(f"Journal entries: {len(entries)}", content_style))
-    story.append(PageBreak())
+    with os.scandir(screenshots_dir) as it:
+        png_count = sum(1 for e in it if e.name.endswith('.png'))
+
+    # Build document content, starting with the title page
+    story = [
+        Spacer(1, 2*inch),
+        Paragraph(title, title_style),
+        Spacer(1, 0.5*inch),
+        Paragraph("VVroom Application Test Report", styles['Heading2']),
+        Spacer(1, 0.3*inch),
+        Paragraph(f"Generated from: {screenshots_dir.parent.name}/quality-journal.md", content_style),
+        Paragraph(f"Screenshots: {png_count} images", content_style),
+        Paragraph(f"Journal entries: {len(entries)}", content_style),
+        PageBreak(),
+    ]
+    add = story.append
+
+    # Calculate available space (leave room for caption)
+    available_height = USABLE_HEIGHT - 1*inch
+
+    # Probe screenshot dimensions concurrently; a failed probe re-raises
+    # from result() inside the per-screenshot error handling below
+    size_futures = {}
+    with ThreadPoolExecutor() as executor:
+        for entry in entries:
+            for screenshot in entry.screenshots:
+                if screenshot not in size_futures:
+                    size_futures[screenshot] = executor.submit(_image_size, screenshots_dir / screenshot)
 
     # Process each entry
     images_included = set()
 
     for entry in entries:
-        # Timestamp header
-        story.append(Paragraph(f"📅 {entry.timestamp}", timestamp_style))
-
         # Content - escape special characters for ReportLab
-        content_escaped = (entry.content
-            .replace('&', '&amp;')
-            .replace('<', '&lt;')
-            .replace('>', '&gt;')
-            .replace('\n', '<br/>')
-        )
-
-        # Highlight test IDs
-        content_escaped = re.sub(
-            r'\b([VUP][\d.]+)\b',
-            r'<b>\1</b>',
-            content_escaped
-        )
-
-        # Highlight PASS/FAIL
-        content_escaped = content_escaped.replace('PASS', '<font color="green"><b>PASS</b></font>')
-        content_escaped = content_escaped.replace('FAIL', '<font color="red"><b>FAIL</b></font>')
-
-        # Category completion styling
+        content_escaped = entry.content.translate(_MARKUP_ESCAPE)
+
+        # Highlight test IDs and PASS/FAIL
+        content_escaped = _RE_MARKUP.sub(_markup_html, content_escaped)
+
+        # Category completion styling keeps its own timestamp header; plain
+        # entries carry the timestamp inline, one flowable per entry
         if entry.is_category_complete:
-            story.append(Paragraph(content_escaped, category_style))
+            add(Paragraph(f"📅 {entry.timestamp}", timestamp_style))
+            add(Paragraph(content_escaped, category_style))
         else:
-            story.append(Paragraph(content_escaped, content_style))
+            add(Paragraph(
+                f'<font color="darkblue"><b>📅 {entry.timestamp}</b></font><br/>{content_escaped}',
+                entry_style
+            ))
 
         # Add screenshots for this entry
         for screenshot in entry.screenshots:
@@ -355,47 +392,41 @@ def create_pdf(entries: list[JournalEntry], screenshots_dir: Path, output_path:
             images_included.add(screenshot)
 
             try:
-                # Calculate available space (leave room for caption)
-                available_height = USABLE_HEIGHT - 1*inch
-
-                with Image.open(img_path) as img:
-                    img_width, img_height = img.size
-
-                    # Scale to fit width
-                    scale = USABLE_WIDTH / img_width
-                    scaled_height = img_height * scale
-
-                    # Check if we can fit with up to 20% shrink
-                    if scaled_height <= available_height * 1.25:
-                        # Fit on one page
-                        final_scale = min(scale, available_height / img_height)
-                        final_width = img_width * final_scale
-                        final_height = img_height * final_scale
-
-                        img_flowable = RLImage(str(img_path), width=final_width, height=final_height)
-                        story.append(img_flowable)
-                        story.append(Paragraph(f"Screenshot: {screenshot}", image_caption_style))
+                img_width, img_height = size_futures[screenshot].result()
+
+                # Scale to fit width
+                scale = USABLE_WIDTH / img_width
+                scaled_height = img_height * scale
+
+                # Check if we can fit with up to 20% shrink
+                if scaled_height <= available_height * 1.25:
+                    # Fit on one page
+                    final_scale = min(scale, available_height / img_height)
+                    final_width = img_width * final_scale
+                    final_height = img_height * final_scale
+
+                    add(RLImage(str(img_path), width=final_width, height=final_height))
+                    add(Paragraph(f"Screenshot: {screenshot}", image_caption_style))
+                else:
+                    # Image is too tall - need to split across pages
+                    # For simplicity with flowables, we'll just scale to fit and note it's reduced
+                    final_height = available_height
+                    final_scale = final_height / img_height
+                    final_width = img_width * final_scale
+
+                    # If image is much taller, we may need to use the page-splitting approach
+                    if scaled_height > available_height * 2:
+                        # Very tall image - use multi-page approach
+                        add(PageBreak())
+                        add_split_image(story, img_path, USABLE_WIDTH, USABLE_HEIGHT, image_caption_style, screenshot)
                     else:
-                        # Image is too tall - need to split across pages
-                        # For simplicity with flowables, we'll just scale to fit and note it's reduced
-                        final_height = available_height
-                        final_scale = final_height / img_height
-                        final_width = img_width * final_scale
-
-                        # If image is much taller, we may need to use the page-splitting approach
-                        if scaled_height > available_height * 2:
-                            # Very tall image - use multi-page approach
-                            story.append(PageBreak())
-                            add_split_image(story, img_path, USABLE_WIDTH, USABLE_HEIGHT, image_caption_style, screenshot)
-                        else:
-                            img_flowable = RLImage(str(img_path), width=final_width, height=final_height)
-                            story.append(img_flowable)
-                            story.append(Paragraph(f"Screenshot: {screenshot} (scaled to fit)", image_caption_style))
+                        add(RLImage(str(img_path), width=final_width, height=final_height))
+                        add(Paragraph(f"Screenshot: {screenshot} (scaled to fit)", image_caption_style))
 
             except Exception as e:
-                story.append(Paragraph(f"[Error loading {screenshot}: {e}]", content_style))
+                add(Paragraph(f"[Error loading {screenshot}: {e}]", content_style))
 
-        story.append(Spacer(1, 0.2*inch))
+        add(Spacer(1, 0.2*inch))
 
     # Build the PDF
     doc.build(story)
@@ -429,26 +460,28 @@ def add_split_image(story, img_path: Path, usable_width: float, usable_height: f
         num_pages = int((scaled_height + usable_height - 1) // usable_height)
         crop_height_per_page = usable_height / scale
 
+        add = story.append
         for page_num in range(num_pages):
             crop_y_start = int(page_num * crop_height_per_page)
             crop_y_end = min(int((page_num + 1) * crop_height_per_page), img_height)
 
             cropped = img.crop((0, crop_y_start, img_width, crop_y_end))
 
-            # Save to temp buffer
+            # Save to temp buffer - fastest zlib level, as ReportLab decodes the
+            # slice and deflates the pixels again when embedding it; the buffer
+            # lives in the story until build, so it stays compressed
             buffer = BytesIO()
-            cropped.save(buffer, format='PNG')
+            cropped.save(buffer, format='PNG', compress_level=1)
             buffer.seek(0)
 
             # Calculate dimensions for this slice
             slice_height = (crop_y_end - crop_y_start) * scale
 
-            img_flowable = RLImage(buffer, width=usable_width, height=slice_height)
-            story.append(img_flowable)
-            story.append(Paragraph(f"{filename} ({page_num + 1}/{num_pages})", caption_style))
+            add(RLImage(buffer, width=usable_width, height=slice_height))
+            add(Paragraph(f"{filename} ({page_num + 1}/{num_pages})", caption_style))
 
             if page_num < num_pages - 1:
-                story.append(PageBreak())
+                add(PageBreak())
 
 
 def main():